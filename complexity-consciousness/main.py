@@ -1,7 +1,49 @@
 from manim import *
+import os
 
-class ComplexityConsciousness(Scene):
-    def construct(self):
+from manimations.glow import GlowCamera, GlowStroke, Halo
+from manimations.orbits import Orbits, RunOrbits
+from manimations.particles import AnimateParticles, ParticleCamera, ParticleCloud
+from manimations.sections import SectionedScene
+from manimations.segments import GrowSegments, Segments, SegmentsCamera
+from manimations.signals import FirePulses, Signals, cascade
+
+
+# Define the complexity-consciousness correlation function
+# Using a logarithmic curve that starts near origin and curves upward
+def complexity_curve(x):
+    # Logarithmic growth: y = a * log(x + 1) + b * x^0.7
+    # This creates a curve that accelerates upward
+    return 2.5 * np.log(x + 1) + 0.4 * (x ** 0.7)
+
+
+# How many particles the atoms stage starts from. More make a denser cloud
+# of smaller particles covering the same area, e.g. COMPLEXITY_PARTICLES=10000
+PARTICLES_ENV = "COMPLEXITY_PARTICLES"
+DEFAULT_PARTICLES = 12
+
+
+class SceneCamera(GlowCamera, ParticleCamera, SegmentsCamera):
+    """Draws the glows, particles and networks, see glow.py, particles.py and segments.py in manimations/."""
+
+
+class ComplexityConsciousness(SectionedScene):
+    # Each section can be rendered on its own, see manimations/sections.py
+    SECTIONS = (
+        "intro",
+        "curve",
+        "atoms",
+        "molecules",
+        "cells",
+        "organisms",
+        "noosphere",
+        "finale",
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(camera_class=SceneCamera, **kwargs)
+
+    def section_intro(self):
         # ===== COMMIT 10: FINAL POLISH =====
         # High quality render settings applied via command line:
         # For 1080p60: manim -pqh --fps 60 complexity-consciousness/main.py ComplexityConsciousness
@@ -11,14 +53,14 @@ class ComplexityConsciousness(Scene):
         self.camera.background_color = "#001a33"  # Dark blue
 
         # Create the title
-        title = Text(
+        self.title = Text(
             "Law of Complexity-Consciousness",
             font_size=48,
             color=WHITE
         ).to_edge(UP, buff=0.5)
 
         # Create axes with custom range and labels
-        axes = Axes(
+        self.axes = Axes(
             x_range=[0, 10, 1],
             y_range=[0, 10, 1],
             x_length=10,
@@ -34,20 +76,20 @@ class ComplexityConsciousness(Scene):
         ).shift(DOWN * 0.5)
 
         # Create axis labels
-        x_label = Text(
+        self.x_label = Text(
             "Material Complexity",
             font_size=32,
             color=BLUE_C
-        ).next_to(axes.x_axis, DOWN, buff=0.3).shift(RIGHT * 2)
+        ).next_to(self.axes.x_axis, DOWN, buff=0.3).shift(RIGHT * 2)
 
-        y_label = Text(
+        self.y_label = Text(
             "Consciousness",
             font_size=32,
             color=BLUE_C
-        ).next_to(axes.y_axis, LEFT, buff=0.3).rotate(PI / 2).shift(UP * 1)
+        ).next_to(self.axes.y_axis, LEFT, buff=0.3).rotate(PI / 2).shift(UP * 1)
 
         # Create subtle grid lines
-        grid = NumberPlane(
+        self.grid = NumberPlane(
             x_range=[0, 10, 1],
             y_range=[0, 10, 1],
             x_length=10,
@@ -66,144 +108,132 @@ class ComplexityConsciousness(Scene):
         ).shift(DOWN * 0.5)
 
         # Animate the scene construction
-        self.play(FadeIn(title), run_time=1)
+        self.play(FadeIn(self.title), run_time=1)
         self.wait(0.5)
 
         # Show grid first (background)
-        self.play(Create(grid), run_time=1.5)
+        self.play(Create(self.grid), run_time=1.5)
 
         # Then show axes
         self.play(
-            Create(axes),
+            Create(self.axes),
             run_time=2,
             rate_func=smooth
         )
 
         # Finally show labels
         self.play(
-            Write(x_label),
-            Write(y_label),
+            Write(self.x_label),
+            Write(self.y_label),
             run_time=1.5
         )
 
         self.wait(0.5)
 
+    def section_curve(self):
         # ===== COMMIT 2: THE CORRELATION CURVE =====
 
-        # Define the complexity-consciousness correlation function
-        # Using a logarithmic curve that starts near origin and curves upward
-        def complexity_curve(x):
-            # Logarithmic growth: y = a * log(x + 1) + b * x^0.7
-            # This creates a curve that accelerates upward
-            return 2.5 * np.log(x + 1) + 0.4 * (x ** 0.7)
-
-        # Create the main curve
-        curve = axes.plot(
+        # Create the main curve with two glow layers (wider, semi-transparent
+        # strokes behind it), drawn as one object along with the curve
+        self.curve = GlowStroke.plot(
+            self.axes,
             complexity_curve,
             x_range=[0, 9.5],
-            color=BLUE,
+            # Apply gradient coloring: blue → purple → orange → white
+            colors=[BLUE, PURPLE, ORANGE, WHITE],
             stroke_width=4,
+            halo=[Halo(20, 0.2), Halo(12, 0.4)],
         )
 
-        # Apply gradient coloring: blue → purple → orange → white
-        curve.set_color_by_gradient(BLUE, PURPLE, ORANGE, WHITE)
-
-        # Create glow effect (wider, semi-transparent copy behind the curve)
-        glow = axes.plot(
-            complexity_curve,
-            x_range=[0, 9.5],
-            stroke_width=12,
-            stroke_opacity=0.4,
-        )
-        glow.set_color_by_gradient(BLUE, PURPLE, ORANGE, WHITE)
-
-        # Create a second, softer glow layer
-        glow_soft = axes.plot(
-            complexity_curve,
-            x_range=[0, 9.5],
-            stroke_width=20,
-            stroke_opacity=0.2,
-        )
-        glow_soft.set_color_by_gradient(BLUE, PURPLE, ORANGE, WHITE)
-
-        # Animate the curve drawing from left to right
+        # Animate the curve drawing from left to right: first the softer glow
+        # layer alone, then the other glow layer and the curve over it
+        glow_soft, glow = self.curve.halo
+        stroke_width, glow_opacity = self.curve.get_stroke_width(), glow.opacity
+        self.curve.set_stroke(width=0)
+        glow.opacity = 0
         self.play(
-            Create(glow_soft),
+            Create(self.curve),
             run_time=2.5,
             rate_func=smooth
         )
 
+        self.curve.set_stroke(width=stroke_width)
+        glow.opacity = glow_opacity
+        glow_soft.whole = True
         self.play(
-            Create(glow),
-            Create(curve),
+            Create(self.curve),
             run_time=2.5,
             rate_func=smooth
         )
 
         self.wait(1)
 
+    def section_atoms(self):
         # ===== COMMIT 3: STAGE 1 - PARTICLES/ATOMS =====
 
         # Define position on curve for atoms (early stage, low complexity)
         atoms_x = 1.5
         atoms_y = complexity_curve(atoms_x)
-        atoms_point = axes.coords_to_point(atoms_x, atoms_y)
+        atoms_point = self.axes.coords_to_point(atoms_x, atoms_y)
 
         # Create a marker dot on the curve
-        stage_marker = Dot(atoms_point, color=BLUE, radius=0.1)
-        self.play(FadeIn(stage_marker), run_time=0.5)
+        self.stage_marker = Dot(atoms_point, color=BLUE, radius=0.1)
+        self.play(FadeIn(self.stage_marker), run_time=0.5)
         self.wait(0.3)
 
-        # Create small particles appearing randomly around the marker
-        num_particles = 12
-        particles = VGroup()
-
-        for i in range(num_particles):
-            # Random offset around the marker point
-            offset_x = np.random.uniform(-0.8, 0.8)
-            offset_y = np.random.uniform(-0.8, 0.8)
-            particle_pos = atoms_point + RIGHT * offset_x + UP * offset_y
-
-            particle = Dot(
-                particle_pos,
-                color=BLUE_C,
-                radius=0.06
-            )
-            particles.add(particle)
+        # Create small particles appearing randomly around the marker, kept
+        # as arrays so that there can be thousands of them; a denser cloud
+        # has smaller particles, covering as much as the default dozen
+        num_particles = int(os.environ.get(PARTICLES_ENV, DEFAULT_PARTICLES))
+        offsets = np.zeros((num_particles, 3))
+        offsets[:, :2] = np.random.uniform(-0.8, 0.8, (num_particles, 2))
+        particle_positions = atoms_point + offsets
+        particles = ParticleCloud(
+            particle_positions - UP * 0.2,
+            radii=0.06 * np.sqrt(DEFAULT_PARTICLES / num_particles),
+            opacities=0,
+            color=BLUE_C
+        )
 
-        # Animate particles appearing with random motion
+        # Animate particles appearing with random motion, their starts spread
+        # like those of a dozen animations in a LaggedStart with lag_ratio 0.1
         self.play(
-            LaggedStart(
-                *[FadeIn(p, shift=UP * 0.2) for p in particles],
-                lag_ratio=0.1
+            AnimateParticles(
+                particles,
+                positions=particle_positions,
+                opacities=1,
+                spread=1.1 / 2.1
             ),
             run_time=1.5
         )
 
         # Add slight random motion to particles
-        particle_animations = []
-        for p in particles:
-            new_pos = p.get_center() + RIGHT * np.random.uniform(-0.3, 0.3) + UP * np.random.uniform(-0.3, 0.3)
-            particle_animations.append(p.animate.move_to(new_pos))
-
-        self.play(*particle_animations, run_time=1, rate_func=there_and_back)
+        jitter = np.zeros((num_particles, 3))
+        jitter[:, :2] = np.random.uniform(-0.3, 0.3, (num_particles, 2))
+        self.play(
+            AnimateParticles(particles, positions=particle_positions + jitter),
+            run_time=1,
+            rate_func=there_and_back
+        )
 
         # Group particles together at the marker
         self.play(
-            *[p.animate.move_to(atoms_point) for p in particles],
+            AnimateParticles(particles, positions=atoms_point),
             run_time=1.5,
             rate_func=smooth
         )
 
         # Fade out all but one particle
-        particles_to_fade = particles[1:]
+        opacities = np.zeros(num_particles)
+        opacities[0] = 1
         self.play(
-            *[FadeOut(p) for p in particles_to_fade],
+            AnimateParticles(particles, opacities=opacities),
             run_time=0.8
         )
 
         # Zoom in on the remaining particle (transform into atom)
-        single_particle = particles[0]
+        single_particle = particles.particle(0)
+        self.remove(particles)
 
         # Create atom structure: nucleus + electron orbits
         nucleus = Dot(atoms_point, color=BLUE_B, radius=0.12)
@@ -216,33 +246,36 @@ class ComplexityConsciousness(Scene):
         orbit2.move_to(atoms_point)
         orbit2.rotate(PI / 3)  # Tilted orbit
 
-        # Electrons on orbits
-        electron1 = Dot(orbit1.point_from_proportion(0), color=BLUE_A, radius=0.08)
-        electron2 = Dot(orbit2.point_from_proportion(0.5), color=BLUE_A, radius=0.08)
+        # Electrons on orbits: one at the start of the first orbit, one
+        # halfway round the tilted one, going round at 2 and -1.5 radians
+        # per second
+        electrons = Orbits(
+            atoms_point,
+            radii=[0.4, 0.65],
+            speeds=[2, -1.5],
+            phases=[0, PI + PI / 3],
+            particle_radii=0.08,
+            color=BLUE_A
+        )
 
-        atom_structure = VGroup(orbit1, orbit2, nucleus, electron1, electron2)
+        atom_structure = VGroup(orbit1, orbit2, nucleus, electrons)
 
         # Transform particle into atom
         self.play(
             ReplacementTransform(single_particle, nucleus),
             FadeIn(orbit1),
             FadeIn(orbit2),
-            FadeIn(electron1),
-            FadeIn(electron2),
+            FadeIn(electrons),
             run_time=1.5
         )
 
         # Animate electrons orbiting
-        def update_electron1(mob, dt):
-            mob.rotate(2 * dt, about_point=atoms_point)
-
-        def update_electron2(mob, dt):
-            mob.rotate(-1.5 * dt, about_point=atoms_point)
+        # Placed from the time on the orbits' clock rather than rotated a
+        # little further every frame, so they never drift
+        def orbit_electrons(run_time):
+            return [RunOrbits(electrons, run_time=run_time)]
 
-        electron1.add_updater(update_electron1)
-        electron2.add_updater(update_electron2)
-
-        self.wait(1.5)
+        self.play(*orbit_electrons(1.5))
 
         # Add "Atoms" label
         atoms_label = Text("Atoms", font_size=28, color=BLUE_C)
@@ -269,34 +302,32 @@ class ComplexityConsciousness(Scene):
             Create(label_line),
             Write(atoms_label),
             FadeIn(atoms_subtitle, shift=UP * 0.2),
+            *orbit_electrons(1),
             run_time=1
         )
 
-        self.wait(1.5)
+        self.play(*orbit_electrons(1.5))
 
-        # Remove electron updaters and fade out atom for next stage
-        electron1.remove_updater(update_electron1)
-        electron2.remove_updater(update_electron2)
+        # Leave the atom for the next stage to fade out
+        self.stage_mobjects = [atom_structure, atoms_label, label_line, atoms_subtitle]
 
         self.wait(0.5)
 
+    def section_molecules(self):
         # ===== COMMIT 4: STAGE 2 - MOLECULES =====
 
         # Define position on curve for molecules (higher complexity)
         molecules_x = 3.5
         molecules_y = complexity_curve(molecules_x)
-        molecules_point = axes.coords_to_point(molecules_x, molecules_y)
+        molecules_point = self.axes.coords_to_point(molecules_x, molecules_y)
 
         # Create new stage marker
         molecules_marker = Dot(molecules_point, color=PURPLE, radius=0.1)
 
         # Fade out atom structure and move marker to new position
         self.play(
-            stage_marker.animate.move_to(molecules_point).set_color(PURPLE),
-            FadeOut(atom_structure),
-            FadeOut(atoms_label),
-            FadeOut(label_line),
-            FadeOut(atoms_subtitle),
+            self.stage_marker.animate.move_to(molecules_point).set_color(PURPLE),
+            *[FadeOut(mob) for mob in self.stage_mobjects],
             run_time=1.5
         )
 
@@ -428,22 +459,23 @@ class ComplexityConsciousness(Scene):
             run_time=1
         )
 
+        # Leave the helix for the next stage to fade out
+        self.stage_mobjects = [dna_helix, molecules_label, molecules_label_line, molecules_subtitle]
+
         self.wait(1)
 
+    def section_cells(self):
         # ===== COMMIT 5: STAGE 3 - CELLS =====
 
         # Define position on curve for cells (even higher complexity)
         cells_x = 5.5
         cells_y = complexity_curve(cells_x)
-        cells_point = axes.coords_to_point(cells_x, cells_y)
+        cells_point = self.axes.coords_to_point(cells_x, cells_y)
 
         # Move marker to new position and fade out DNA
         self.play(
-            stage_marker.animate.move_to(cells_point).set_color(ORANGE),
-            FadeOut(dna_helix),
-            FadeOut(molecules_label),
-            FadeOut(molecules_label_line),
-            FadeOut(molecules_subtitle),
+            self.stage_marker.animate.move_to(cells_point).set_color(ORANGE),
+            *[FadeOut(mob) for mob in self.stage_mobjects],
             run_time=1.5
         )
 
@@ -578,23 +610,23 @@ class ComplexityConsciousness(Scene):
             rate_func=there_and_back
         )
 
+        # Leave the cell for the next stage to fade out
+        self.stage_mobjects = [cell_membrane, cell_organelles, cells_label, cells_label_line, cells_subtitle]
+
         self.wait(0.5)
 
+    def section_organisms(self):
         # ===== COMMIT 6: STAGE 4 - ORGANISMS =====
 
         # Define position on curve for organisms (higher complexity)
         organisms_x = 7.0
         organisms_y = complexity_curve(organisms_x)
-        organisms_point = axes.coords_to_point(organisms_x, organisms_y)
+        organisms_point = self.axes.coords_to_point(organisms_x, organisms_y)
 
         # Move marker to new position and fade out cell
         self.play(
-            stage_marker.animate.move_to(organisms_point).set_color(RED),
-            FadeOut(cell_membrane),
-            FadeOut(cell_organelles),
-            FadeOut(cells_label),
-            FadeOut(cells_label_line),
-            FadeOut(cells_subtitle),
+            self.stage_marker.animate.move_to(organisms_point).set_color(RED),
+            *[FadeOut(mob) for mob in self.stage_mobjects],
             run_time=1.5
         )
 
@@ -677,73 +709,36 @@ class ComplexityConsciousness(Scene):
         self.wait(0.5)
 
         # Create firing/pulsing neural signals
-        # Create dots that travel along connections
-        signal_dots = VGroup()
-        for line in neural_connections[:4]:  # Use first 4 connections
-            dot = Dot(
-                line.get_start(),
-                color=YELLOW,
-                radius=0.08
-            )
-            signal_dots.add(dot)
+        # One pulse per connection, all of them in one mobject
+        signals = Signals.along(cell_positions, connection_pairs, radii=0.08, color=YELLOW)
 
-        self.play(
-            *[FadeIn(dot) for dot in signal_dots],
-            run_time=0.3
-        )
+        # Signals spread in waves from the top and bottom cells: first along
+        # the connections leaving them, then along those leaving the cells
+        # they reach
+        waves = cascade(connection_pairs, sources=[0, 1])
 
-        # Animate signals traveling along connections
-        signal_animations = []
-        for i, dot in enumerate(signal_dots):
-            line = neural_connections[i]
-            signal_animations.append(
-                dot.animate.move_to(line.get_end())
-            )
+        for wave in range(waves.max() + 1):
+            firing = np.flatnonzero(waves == wave)
 
-        self.play(
-            *signal_animations,
-            run_time=1.5,
-            rate_func=smooth
-        )
-
-        # Fade out and repeat with different connections
-        self.play(
-            *[FadeOut(dot) for dot in signal_dots],
-            run_time=0.3
-        )
-
-        # Second wave of signals
-        signal_dots_2 = VGroup()
-        for line in neural_connections[4:]:  # Use remaining connections
-            dot = Dot(
-                line.get_start(),
-                color=YELLOW,
-                radius=0.08
+            self.play(
+                AnimateParticles(signals, opacities=(waves == wave).astype(float)),
+                run_time=0.3
             )
-            signal_dots_2.add(dot)
-
-        self.play(
-            *[FadeIn(dot) for dot in signal_dots_2],
-            run_time=0.3
-        )
 
-        signal_animations_2 = []
-        for i, dot in enumerate(signal_dots_2):
-            line = neural_connections[i + 4]
-            signal_animations_2.append(
-                dot.animate.move_to(line.get_end())
+            # Animate signals traveling along connections
+            self.play(
+                FirePulses(signals, indices=firing),
+                run_time=1.5,
+                rate_func=smooth
             )
 
-        self.play(
-            *signal_animations_2,
-            run_time=1.5,
-            rate_func=smooth
-        )
+            # Fade out and repeat with the next wave
+            self.play(
+                AnimateParticles(signals, opacities=0),
+                run_time=0.3
+            )
 
-        self.play(
-            *[FadeOut(dot) for dot in signal_dots_2],
-            run_time=0.3
-        )
+        self.remove(signals)
 
         # Add "Organisms" label
         organisms_label = Text("Organisms", font_size=28, color=RED)
@@ -773,24 +768,26 @@ class ComplexityConsciousness(Scene):
             run_time=1
         )
 
+        # Leave the organism for the next stage to fade out
+        self.stage_mobjects = [
+            cells_network, brain_node, neural_connections,
+            organisms_label, organisms_label_line, organisms_subtitle,
+        ]
+
         self.wait(1)
 
+    def section_noosphere(self):
         # ===== COMMIT 7: STAGE 5 - NOOSPHERE =====
 
         # Define position on curve for noosphere (very high complexity)
         noosphere_x = 8.5
         noosphere_y = complexity_curve(noosphere_x)
-        noosphere_point = axes.coords_to_point(noosphere_x, noosphere_y)
+        noosphere_point = self.axes.coords_to_point(noosphere_x, noosphere_y)
 
         # Move marker to new position and fade out organisms
         self.play(
-            stage_marker.animate.move_to(noosphere_point).set_color(GOLD),
-            FadeOut(cells_network),
-            FadeOut(brain_node),
-            FadeOut(neural_connections),
-            FadeOut(organisms_label),
-            FadeOut(organisms_label_line),
-            FadeOut(organisms_subtitle),
+            self.stage_marker.animate.move_to(noosphere_point).set_color(GOLD),
+            *[FadeOut(mob) for mob in self.stage_mobjects],
             run_time=1.5
         )
 
@@ -819,10 +816,10 @@ class ComplexityConsciousness(Scene):
             radius=0.08
         )
 
-        earth_group = VGroup(earth, earth_detail1, earth_detail2)
+        self.earth_group = VGroup(earth, earth_detail1, earth_detail2)
 
         self.play(
-            FadeIn(earth_group),
+            FadeIn(self.earth_group),
             run_time=1
         )
 
@@ -831,7 +828,7 @@ class ComplexityConsciousness(Scene):
         # Create brain/head silhouettes around Earth
         num_brains = 8
         brain_radius = 1.2  # Distance from center
-        brains = VGroup()
+        self.brains = VGroup()
 
         for i in range(num_brains):
             angle = i * 2 * PI / num_brains
@@ -846,12 +843,12 @@ class ComplexityConsciousness(Scene):
                 fill_color=WHITE
             ).move_to(pos)
 
-            brains.add(brain_circle)
+            self.brains.add(brain_circle)
 
         # Animate brains appearing
         self.play(
             LaggedStart(
-                *[FadeIn(brain, scale=0.5) for brain in brains],
+                *[FadeIn(brain, scale=0.5) for brain in self.brains],
                 lag_ratio=0.1
             ),
             run_time=2
@@ -859,100 +856,82 @@ class ComplexityConsciousness(Scene):
 
         self.wait(0.5)
 
-        # Create dense network of connections between brains
-        connections = VGroup()
+        # Create dense network of connections between brains, all of them
+        # in one mobject
+        brain_points = [brain.get_center() for brain in self.brains]
 
-        # Connect each brain to multiple others
-        for i in range(num_brains):
-            # Connect to next 3 brains in the circle
-            for j in range(1, 4):
-                next_idx = (i + j) % num_brains
-                line = Line(
-                    brains[i].get_center(),
-                    brains[next_idx].get_center(),
-                    color=GOLD,
-                    stroke_width=1.5,
-                    stroke_opacity=0.5
-                )
-                connections.add(line)
+        # Connect each brain to the next 3 brains in the circle
+        brain_pairs = [(i, (i + j) % num_brains) for i in range(num_brains) for j in range(1, 4)]
+        self.connections = Segments.along(
+            brain_points,
+            brain_pairs,
+            stroke_color=GOLD,
+            stroke_width=1.5,
+            stroke_opacity=0.5
+        )
 
         # Add connections from brains to Earth (collective consciousness)
-        earth_connections = VGroup()
-        for brain in brains:
-            line = Line(
-                brain.get_center(),
-                noosphere_point,
-                color=YELLOW,
-                stroke_width=1,
-                stroke_opacity=0.3
-            )
-            earth_connections.add(line)
+        self.earth_connections = Segments(
+            brain_points,
+            [noosphere_point] * num_brains,
+            stroke_color=YELLOW,
+            stroke_width=1,
+            stroke_opacity=0.3
+        )
 
-        # Animate network forming
+        # Animate network forming, one connection after the other
         self.play(
-            LaggedStart(
-                *[Create(line) for line in earth_connections],
-                lag_ratio=0.05
-            ),
+            GrowSegments(self.earth_connections, lag_ratio=0.05),
             run_time=2
         )
 
         self.play(
-            LaggedStart(
-                *[Create(line) for line in connections],
-                lag_ratio=0.02
-            ),
+            GrowSegments(self.connections, lag_ratio=0.02),
             run_time=2.5
         )
 
         self.wait(0.5)
 
-        # Create sphere around the network (noosphere boundary)
-        noosphere_sphere = Circle(
-            radius=brain_radius + 0.3,
-            color=GOLD,
-            stroke_width=2,
-            stroke_opacity=0.6
-        ).move_to(noosphere_point)
-
-        # Create a subtle glow around the sphere
-        sphere_glow = Circle(
-            radius=brain_radius + 0.4,
-            color=WHITE,
-            stroke_width=4,
-            stroke_opacity=0.3
+        # Create sphere around the network (noosphere boundary), with a
+        # subtle glow just outside it at half its opacity
+        self.noosphere_sphere = GlowStroke.of(
+            Circle(
+                radius=brain_radius + 0.3,
+                color=GOLD,
+                stroke_width=2,
+                stroke_opacity=0.6
+            ),
+            halo=[Halo(4, 0.5, WHITE, scale=(brain_radius + 0.4) / (brain_radius + 0.3))],
         ).move_to(noosphere_point)
 
         self.play(
-            Create(sphere_glow),
-            Create(noosphere_sphere),
+            Create(self.noosphere_sphere),
             run_time=2,
             rate_func=smooth
         )
 
         # Pulse the entire noosphere
         self.play(
-            noosphere_sphere.animate.scale(1.1),
-            sphere_glow.animate.scale(1.1),
+            self.noosphere_sphere.animate.scale(1.1),
             run_time=1,
             rate_func=there_and_back
         )
 
         # Add "Noosphere" label
-        noosphere_label = Text("Noosphere", font_size=28, color=GOLD)
-        noosphere_label.next_to(noosphere_point, DOWN, buff=1.8)
+        self.noosphere_label = Text("Noosphere", font_size=28, color=GOLD)
+        self.noosphere_label.next_to(noosphere_point, DOWN, buff=1.8)
 
         # Label line
-        noosphere_label_line = Line(
+        self.noosphere_label_line = Line(
             noosphere_point + DOWN * (brain_radius + 0.3),
-            noosphere_label.get_top(),
+            self.noosphere_label.get_top(),
             color=GOLD,
             stroke_width=1.5,
             stroke_opacity=0.6
         )
 
         # Add subtitle explanation (COMMIT 10)
-        noosphere_subtitle = Text(
+        self.noosphere_subtitle = Text(
             "Humanity forms a planetary sphere of collective consciousness and thought",
             font_size=20,
             color=GOLD,
@@ -960,39 +939,39 @@ class ComplexityConsciousness(Scene):
         ).to_edge(DOWN, buff=0.3)
 
         self.play(
-            Create(noosphere_label_line),
-            Write(noosphere_label),
-            FadeIn(noosphere_subtitle, shift=UP * 0.2),
+            Create(self.noosphere_label_line),
+            Write(self.noosphere_label),
+            FadeIn(self.noosphere_subtitle, shift=UP * 0.2),
             run_time=1
         )
 
         # Final pulse showing the living noosphere
         self.play(
-            noosphere_sphere.animate.scale(1.08),
-            sphere_glow.animate.scale(1.08),
+            self.noosphere_sphere.animate.scale(1.08),
             run_time=1.5,
             rate_func=there_and_back
         )
 
         self.wait(1)
 
+    def section_finale(self):
         # ===== COMMIT 9: SMOOTH TRANSITIONS & TIMING =====
 
         # Slowly zoom out to show the complete evolutionary journey
         # Group everything for the final zoom out
         everything = VGroup(
-            grid, axes, x_label, y_label, title,
-            glow_soft, glow, curve,
-            stage_marker,
-            earth_group, brains, earth_connections, connections,
-            noosphere_sphere, sphere_glow,
-            noosphere_label, noosphere_label_line
+            self.grid, self.axes, self.x_label, self.y_label, self.title,
+            self.curve,
+            self.stage_marker,
+            self.earth_group, self.brains, self.earth_connections, self.connections,
+            self.noosphere_sphere,
+            self.noosphere_label, self.noosphere_label_line
         )
 
         # Zoom out smoothly to reveal the full journey
         self.play(
             everything.animate.scale(0.88).shift(DOWN * 0.25),
-            FadeOut(noosphere_subtitle),
+            FadeOut(self.noosphere_subtitle),
             run_time=4,
             rate_func=smooth
         )
@@ -1001,8 +980,7 @@ class ComplexityConsciousness(Scene):
 
         # Final celebratory pulse of the noosphere
         self.play(
-            noosphere_sphere.animate.scale(1.12),
-            sphere_glow.animate.scale(1.12),
+            self.noosphere_sphere.animate.scale(1.12),
             run_time=2,
             rate_func=there_and_back
         )
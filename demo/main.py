@@ -1,6 +1,224 @@
-def main():
-    print("Hello from manimations!")
+"""
+Render driver for the manimations collection.
+
+Finds every Scene subclass in the project directories and renders them
+across a pool of manim processes, then reports the wall time and exit code
+of each scene.
+
+    uv run demo/main.py list
+    uv run demo/main.py render --jobs 4 -q h
+    uv run demo/main.py render holarchy GitAndTreeSplit -- --fps 60
+    uv run demo/main.py render ComplexityConsciousness --split-sections -q h -- --fps 60
+    uv run demo/main.py render GitAndTreeSplit --trace
+    uv run demo/main.py cache stats
+    uv run demo/main.py bench -q l m h --threshold 0.15
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from manimations import bench
+from manimations.cache import CACHE_MAX_MB_ENV, RenderCache
+from manimations.launch import NO_CACHE_ENV
+from manimations.render import (
+    PROJECT_ROOT,
+    discover_scenes,
+    format_report,
+    join_sections,
+    render_all,
+    select_scenes,
+    split_sections,
+)
+from manimations.trace import TRACE_ENV
+
+
+def positive_int(value):
+    """Parse a count that must be at least 1, for argparse."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="manimations", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("list", help="list the scenes that would be rendered")
+
+    render = commands.add_parser("render", help="render scenes in parallel")
+    render.add_argument("scenes", nargs="*", help="scene class or project directory names (default: all)")
+    render.add_argument("-j", "--jobs", type=positive_int, default=None, help="number of concurrent renders (default: CPU count)")
+    render.add_argument("-q", "--quality", default="l", choices=["l", "m", "h", "p", "k"], help="manim quality preset")
+    render.add_argument(
+        "--split-sections",
+        action="store_true",
+        help="render each section of a sectioned scene in its own process and join the results",
+    )
+    render.add_argument("--no-cache", action="store_true", help="bypass the shared segment cache")
+    render.add_argument("--trace", action="store_true", help="write a Chrome trace of every play/wait per scene")
+    render.add_argument(
+        "--trace-dir", type=Path, default=PROJECT_ROOT / "media" / "traces", help="where --trace writes its files",
+    )
+    render.add_argument("--cache-size", type=float, default=None, help="cache budget in MB before LRU eviction")
+
+    bench_parser = commands.add_parser("bench", help="benchmark scenes across quality presets")
+    bench_parser.add_argument("scenes", nargs="*", help="scene class or project directory names (default: all)")
+    bench_parser.add_argument(
+        "-q", "--quality", nargs="+", default=list(bench.DEFAULT_QUALITIES),
+        choices=["l", "m", "h", "p", "k"], help="quality presets to benchmark",
+    )
+    bench_parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown before failing (0.15 = 15%%)")
+    bench_parser.add_argument("--history", type=Path, default=bench.DEFAULT_HISTORY, help="JSON file the run is appended to")
+    bench_parser.add_argument("--baseline", type=Path, default=bench.DEFAULT_BASELINE, help="JSON file to compare against")
+    bench_parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+
+    cache = commands.add_parser("cache", help="inspect or manage the shared segment cache")
+    cache.add_argument("action", choices=["stats", "prune", "reset-stats", "clear"], help="what to do")
+    cache.add_argument("--cache-size", type=float, default=None, help="cache budget in MB, for prune")
+
+    return parser
+
+
+def cmd_list(args):
+    for spec in discover_scenes():
+        print(f"{spec}  ({spec.path.relative_to(spec.path.parent.parent)})")
+    return 0
+
+
+def cmd_render(args):
+    specs = select_scenes(discover_scenes(), args.scenes)
+    if not specs:
+        print("No matching scenes found.", file=sys.stderr)
+        return 1
+    if args.split_sections:
+        specs = split_sections(specs)
+
+    # The render processes read their cache settings from the environment
+    if args.no_cache:
+        os.environ[NO_CACHE_ENV] = "1"
+    if args.cache_size is not None:
+        os.environ[CACHE_MAX_MB_ENV] = str(args.cache_size)
+    if args.trace:
+        os.environ[TRACE_ENV] = str(args.trace_dir.resolve())
+    cache_before = RenderCache.from_env().stats()
+
+    def on_result(result):
+        status = "ok" if result.ok else f"failed ({result.returncode})"
+        print(f"{result.scene}: {status} in {result.wall_time:.2f}s", flush=True)
+        if not result.ok:
+            # Show the end of manim's output so the failure is visible in CI logs
+            print("\n".join(result.output.splitlines()[-20:]), file=sys.stderr)
+
+    results = render_all(specs, jobs=args.jobs, quality=args.quality, extra_args=args.manim_args, on_result=on_result)
+    print()
+    print(format_report(results))
+
+    for spec, output in join_sections(results).items():
+        print(f"{spec}: joined sections into {output.relative_to(PROJECT_ROOT)}")
+
+    if args.trace:
+        print(f"traces written to {args.trace_dir}")
+
+    if not args.no_cache:
+        cache_after = RenderCache.from_env().stats()
+        hits = cache_after["hits"] - cache_before["hits"]
+        misses = cache_after["misses"] - cache_before["misses"]
+        print(f"cache: {hits} segment(s) reused, {misses} rendered")
+    return 0 if all(r.ok for r in results) else 1
+
+
+def cmd_cache(args):
+    cache = RenderCache.from_env()
+    if args.cache_size is not None:
+        cache.max_bytes = int(args.cache_size * 1024 * 1024)
+
+    if args.action == "prune":
+        print(f"Evicted {cache.evict()} segment(s)")
+    elif args.action == "reset-stats":
+        cache.reset_stats()
+    elif args.action == "clear":
+        cache.clear()
+        print(f"Removed {cache.root}")
+    else:
+        stats = cache.stats()
+        print(f"location:  {stats['root']}")
+        print(f"segments:  {stats['entries']}")
+        print(f"size:      {stats['bytes'] / 1024 / 1024:.1f} MB of {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+        print(f"hits:      {stats['hits']}")
+        print(f"misses:    {stats['misses']}")
+        print(f"hit rate:  {stats['hit_rate']:.1%}")
+        print(f"stored:    {stats['stored']}, evicted: {stats['evicted']}")
+    return 0
+
+
+def cmd_bench(args):
+    specs = select_scenes(discover_scenes(), args.scenes)
+    if not specs:
+        print("No matching scenes found.", file=sys.stderr)
+        return 1
+
+    def on_record(record, result):
+        if not result.ok:
+            print(f"{record['scene']} -q{record['quality']}: failed ({result.returncode})", flush=True)
+            print("\n".join(result.output.splitlines()[-20:]), file=sys.stderr)
+            return
+        rss = f"{record['peak_rss'] / 1024 / 1024:.0f} MB" if record["peak_rss"] else "n/a"
+        print(
+            f"{record['scene']} -q{record['quality']}: {record['wall_time']:.2f}s, "
+            f"{record['fps']} frames/s, peak {rss}, {record['output_bytes']} bytes",
+            flush=True,
+        )
+
+    run = bench.run_benchmarks(specs, args.quality, on_record=on_record)
+    bench.append_history(run, args.history)
+    failed = any(record["returncode"] != 0 for record in run["results"])
+
+    if args.save_baseline:
+        bench.save_baseline(run, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+        return 1 if failed else 0
+
+    baseline = bench.load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 1 if failed else 0
+
+    rows = bench.compare(run, baseline, args.threshold)
+    print()
+    print(bench.format_comparison(rows, args.threshold))
+    regressed = any(row["regression"] for row in rows)
+    return 1 if failed or regressed else 0
+
+
+def main(argv=None):
+    handlers = {
+        "list": cmd_list,
+        "render": cmd_render,
+        "cache": cmd_cache,
+        "bench": cmd_bench,
+    }
+
+    # Rendering is the default when no command is given
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or (argv[0] not in handlers and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "render")
+
+    # Everything after ``--`` is handed to manim untouched
+    manim_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, manim_args = argv[:split], argv[split + 1:]
+
+    args = build_parser().parse_args(argv)
+    args.manim_args = manim_args
+    return handlers[args.command](args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
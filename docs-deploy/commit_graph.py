@@ -0,0 +1,118 @@
+"""
+Where every branch, commit and tag of a history is drawn.
+
+A ``CommitGraph`` lays a ``History`` out once, up front: commits go in
+columns by generation, and branches share horizontal lanes whenever one
+ended before the next forked, so dozens of short-lived pull request branches
+need only a handful of lanes. Afterwards every lookup the scene needs, from
+a commit, a (branch, index) pair or a tag to its point, dot, branch line and
+tree entry, is a dictionary or list index, so drawing one more commit costs
+the same however long the history is.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class Lane:
+    index: int
+    y: float
+    branches: list = field(default_factory=list)
+
+
+@dataclass
+class Branch:
+    name: str
+    lane: Lane
+    color: object
+    # Where the branch line starts, at the commit it forked from
+    start: np.ndarray
+    nodes: list = field(default_factory=list)
+    # The branch line is segment line_index of the lines of its color
+    line: object = None
+    line_index: int = None
+    label: object = None
+
+
+@dataclass
+class Node:
+    commit: object
+    branch: Branch
+    point: np.ndarray
+    tags: list = field(default_factory=list)
+    dot: object = None
+    # Path of the commit's build in the deployed tree, once deployed
+    tree_path: tuple = None
+
+
+class CommitGraph:
+    def __init__(self, history, left, top, width, height, colors, max_x_step=1.2, max_lane_step=1.0, tag_height=0.4, tag_spacing=0.6):
+        self.history = history
+        self.left = left
+        self.tag_height = tag_height
+        self.tag_spacing = tag_spacing
+
+        last_column = max((commit.column for commit in history.commits), default=1)
+        self.x_step = min(max_x_step, width / last_column)
+
+        lanes, lane_count = self._assign_lanes(history)
+        self.lane_step = min(max_lane_step, height / max(lane_count - 1, 1))
+        self.lanes = [Lane(index, top - index * self.lane_step) for index in range(lane_count)]
+        self.dot_radius = min(0.12, 0.4 * self.x_step, 0.4 * self.lane_step)
+
+        self.branches = {}
+        self.nodes = {}
+        for position, (name, commits) in enumerate(history.branches.items()):
+            lane = self.lanes[lanes[name]]
+            branch = Branch(
+                name, lane, colors[position % len(colors)],
+                np.array([self.x(commits[0].column - 1), lane.y, 0.0]),
+            )
+            lane.branches.append(branch)
+            self.branches[name] = branch
+            for commit in commits:
+                node = Node(commit, branch, np.array([self.x(commit.column), lane.y, 0.0]))
+                branch.nodes.append(node)
+                self.nodes[commit.sha] = node
+
+        self.tags = {}
+        for name, commit in history.tags.items():
+            node = self.nodes[commit.sha]
+            node.tags.append(name)
+            self.tags[name] = node
+
+    @staticmethod
+    def _assign_lanes(history):
+        # The main branch keeps the top lane; the others take the first lane
+        # that is free by the column they fork at, or open a new one
+        names = list(history.branches)
+        lanes = {names[0]: 0} if names else {}
+        lane_count = len(lanes)
+        free = []
+        others = sorted(names[1:], key=lambda name: history.branches[name][0].column)
+        for name in others:
+            commits = history.branches[name]
+            start, end = commits[0].column - 1, commits[-1].column
+            if free and free[0][0] < start:
+                _, lane = heapq.heappop(free)
+            else:
+                lane = lane_count
+                lane_count += 1
+            lanes[name] = lane
+            heapq.heappush(free, (end, lane))
+        return lanes, lane_count
+
+    def x(self, column):
+        return self.left + column * self.x_step
+
+    def node(self, branch, index):
+        """Return the node of the ``index``-th commit (from 1) of ``branch``."""
+        return self.branches[branch].nodes[index - 1]
+
+    def tag_tip(self, name):
+        """Return the point a tag's marker sits on, stacked above its commit."""
+        node = self.tags[name]
+        return node.point + np.array([0.0, self.tag_height + self.tag_spacing * node.tags.index(name), 0.0])
@@ -0,0 +1,118 @@
+"""
+The deployed documentation tree as data.
+
+Every commit of the main branch is deployed to ``<branch>/<hash>/``, every
+commit of another branch to ``pull/<branch>/<hash>/`` and every tag to
+``tags/<tag>/``, with a ``HEAD`` file next to each branch's builds. A
+``DeployTree`` tracks that layout as commits arrive and renders it as
+``tree``-style lines.
+
+To keep long histories readable (and the rendered tree bounded in size) only
+the newest few builds, branches and tags are listed; the rest are summarized
+in a single ``… N older`` entry.
+"""
+
+# Files deployed for every build
+BUILD_FILES = [("module1/", [("index.html", [])])]
+
+PULL_DIR = "pull/"
+TAGS_DIR = "tags/"
+HEAD_FILE = "HEAD"
+
+
+def branch_dir(name):
+    # "pull/1234" is listed as "1234/" inside the pull directory
+    if name.startswith(PULL_DIR):
+        name = name[len(PULL_DIR):]
+    return name + "/"
+
+
+class Listing:
+    """The newest entries of one directory, with a count of the hidden ones."""
+
+    def __init__(self, keep):
+        self.keep = keep
+        self.entries = []
+        self.hidden = 0
+
+    def add(self, entry):
+        """Add ``entry`` and return the entry it pushed out, if any."""
+        self.entries.append(entry)
+        if len(self.entries) > self.keep:
+            self.hidden += 1
+            return self.entries.pop(0)
+        return None
+
+    def nodes(self, node, noun="older"):
+        nodes = [(f"… {self.hidden} {noun}", [])] if self.hidden else []
+        return nodes + [node(entry) for entry in self.entries]
+
+
+class DeployTree:
+    def __init__(self, main, keep_builds=3, keep_branches=3, keep_tags=2):
+        self.main = main
+        self.keep_builds = keep_builds
+        self.builds = {main: Listing(keep_builds)}
+        self.heads = set()
+        self.branches = Listing(keep_branches)
+        self.tags = Listing(keep_tags)
+
+    def add_commit(self, commit):
+        """Deploy the build of ``commit`` next to its branch's other builds."""
+        if commit.branch not in self.builds:
+            self.builds[commit.branch] = Listing(self.keep_builds)
+            dropped = self.branches.add(commit.branch)
+            if dropped is not None:
+                del self.builds[dropped]
+                self.heads.discard(dropped)
+        self.builds[commit.branch].add(commit.name + "/")
+        return self.build_path(commit)
+
+    def set_head(self, branch):
+        """Add the ``HEAD`` file of ``branch`` and return its path."""
+        self.heads.add(branch)
+        return self.head_path(branch)
+
+    def add_tag(self, name):
+        self.tags.add(name + "/")
+        return (TAGS_DIR, name + "/")
+
+    def branch_path(self, branch):
+        if branch == self.main:
+            return (branch_dir(branch),)
+        return (PULL_DIR, branch_dir(branch))
+
+    def build_path(self, commit):
+        return self.branch_path(commit.branch) + (commit.name + "/",)
+
+    def head_path(self, branch):
+        return self.branch_path(branch) + (HEAD_FILE,)
+
+    def _branch_node(self, branch):
+        children = self.builds[branch].nodes(lambda build: (build, BUILD_FILES))
+        if branch in self.heads:
+            children.append((HEAD_FILE, []))
+        return branch_dir(branch), children
+
+    def nodes(self):
+        """The tree below ``modules/`` as nested ``(name, children)`` pairs."""
+        nodes = []
+        if self.builds[self.main].entries:
+            nodes.append(self._branch_node(self.main))
+        if self.branches.entries:
+            nodes.append((PULL_DIR, self.branches.nodes(self._branch_node, noun="more")))
+        if self.tags.entries:
+            nodes.append((TAGS_DIR, self.tags.nodes(lambda tag: (tag, BUILD_FILES), noun="more")))
+        return nodes
+
+    def lines(self, indent="    "):
+        """Return ``(text, path)`` for every line of the tree below ``modules/``."""
+        return list(tree_lines(self.nodes(), indent))
+
+
+def tree_lines(nodes, prefix="", path=()):
+    """Yield ``(text, path)`` pairs drawing ``nodes`` like the ``tree`` command."""
+    for position, (name, children) in enumerate(nodes):
+        last = position == len(nodes) - 1
+        yield f"{prefix}{'└── ' if last else '├── '}{name}", path + (name,)
+        yield from tree_lines(children, prefix + ("    " if last else "│   "), path + (name,))
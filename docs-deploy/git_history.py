@@ -0,0 +1,169 @@
+"""
+Branches, commits and tags read from a local git repository.
+
+The history comes from one ``git log`` over every selected ref, parsed line
+by line as git writes it, plus one ``git for-each-ref`` for the branch heads
+and tags. Nothing is fetched, so only what is already in the clone is shown.
+
+Each commit is given to exactly one branch: the main branch claims its
+first-parent chain first, then every other branch claims the commits on its
+own first-parent chain down to where it forked. Commits reachable only
+through merges of deleted branches are not shown.
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+
+# Branches tried, in order, when no main branch is given
+MAIN_BRANCHES = ("develop", "main", "master")
+
+DEFAULT_MAX_COMMITS = 500
+
+# Separates the fields of one commit in the git log output
+FIELD_SEP = "\x1f"
+LOG_FORMAT = FIELD_SEP.join(["%H", "%P", "%s"])
+
+
+@dataclass
+class Commit:
+    sha: str
+    parents: tuple
+    subject: str = ""
+    branch: str = None
+    # Position on its branch, starting at 1
+    index: int = 0
+    # Distance from the oldest commit shown, used as the x column
+    column: int = 0
+
+    @property
+    def name(self):
+        # Abbreviated like git's short hashes, other names are kept whole
+        if len(self.sha) == 40:
+            return self.sha[:7]
+        return self.sha
+
+
+@dataclass
+class History:
+    main: str
+    # Branch name to its commits, oldest first, in order of first commit
+    branches: dict = field(default_factory=dict)
+    # Every shown commit, parents before children
+    commits: list = field(default_factory=list)
+    # Tag name to the commit it points at
+    tags: dict = field(default_factory=dict)
+
+
+def _git(repo, *args):
+    return ["git", "-C", str(repo), *args]
+
+
+def iter_log(repo, revs, max_count=DEFAULT_MAX_COMMITS):
+    """Yield ``(sha, parents, subject)`` for ``revs``, oldest first, as git prints them."""
+    args = ["log", "--topo-order", "--reverse", f"--format={LOG_FORMAT}"]
+    if max_count:
+        args.append(f"--max-count={max_count}")
+    process = subprocess.Popen(
+        _git(repo, *args, *revs, "--"),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, encoding="utf-8", errors="replace",
+    )
+    try:
+        for line in process.stdout:
+            sha, parents, subject = line.rstrip("\n").split(FIELD_SEP, 2)
+            yield sha, tuple(parents.split()), subject
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        if process.wait() != 0:
+            raise RuntimeError(f"git log failed in {repo}: {stderr.strip()}")
+
+
+def read_refs(repo):
+    """Return ``(branches, tags)``, each mapping a ref name to its commit."""
+    output = subprocess.run(
+        _git(repo, "for-each-ref", f"--format=%(refname){FIELD_SEP}%(objectname){FIELD_SEP}%(*objectname)",
+             "refs/heads", "refs/tags"),
+        capture_output=True, text=True, check=True,
+    ).stdout
+    branches, tags = {}, {}
+    for line in output.splitlines():
+        ref, sha, peeled = line.split(FIELD_SEP)
+        if ref.startswith("refs/heads/"):
+            branches[ref[len("refs/heads/"):]] = sha
+        else:
+            # Annotated tags point at a tag object; use the commit it peels to
+            tags[ref[len("refs/tags/"):]] = peeled or sha
+    return branches, tags
+
+
+def read_history(repo, main=None, branches=None, max_commits=DEFAULT_MAX_COMMITS):
+    """
+    Read the history of ``repo``.
+
+    ``main`` is the branch deployed as the development docs, picked from
+    ``MAIN_BRANCHES`` when not given. ``branches`` limits the other branches
+    shown; by default every local branch is. Only the newest ``max_commits``
+    commits are read.
+    """
+    heads, tag_refs = read_refs(repo)
+    if main is None:
+        main = next((name for name in MAIN_BRANCHES if name in heads), None)
+    if main not in heads:
+        raise ValueError(f"{repo} has no branch {main!r}")
+    others = [name for name in (branches or heads) if name != main and name in heads]
+
+    commits = {}
+    for sha, parents, subject in iter_log(repo, [heads[main], *(heads[name] for name in others)], max_commits):
+        commits[sha] = Commit(sha, parents, subject)
+
+    history = History(main)
+    for name in [main, *others]:
+        chain = []
+        sha = heads[name]
+        while sha in commits and commits[sha].branch is None:
+            commits[sha].branch = name
+            chain.append(commits[sha])
+            sha = commits[sha].parents[0] if commits[sha].parents else None
+        if chain:
+            history.branches[name] = chain[::-1]
+    # Main branch first, then the others in the order they were started
+    order = {sha: position for position, sha in enumerate(commits)}
+    history.branches = dict(sorted(
+        history.branches.items(),
+        key=lambda item: (item[0] != main, order[item[1][0].sha]),
+    ))
+
+    for name, chain in history.branches.items():
+        for index, commit in enumerate(chain, 1):
+            commit.index = index
+
+    # git printed parents before children, so one pass settles the columns
+    for commit in commits.values():
+        if commit.branch is None:
+            continue
+        commit.column = 1 + max(
+            (commits[parent].column for parent in commit.parents if parent in commits),
+            default=0,
+        )
+        history.commits.append(commit)
+
+    history.tags = {
+        name: commits[sha] for name, sha in tag_refs.items()
+        if sha in commits and commits[sha].branch is not None
+    }
+    return history
+
+
+def demo_history():
+    """The small hand-written history the animation shows by default."""
+    develop1 = Commit("githash1", (), branch="develop", index=1, column=1)
+    develop2 = Commit("githash2", ("githash1",), branch="develop", index=2, column=2)
+    pull1 = Commit("githash3", (), branch="pull/1234", index=1, column=1)
+    return History(
+        main="develop",
+        branches={"develop": [develop1, develop2], "pull/1234": [pull1]},
+        commits=[develop1, develop2, pull1],
+        tags={"v1.0.0": develop2},
+    )
@@ -0,0 +1,325 @@
+"""
+Monospace directory trees assembled from a glyph atlas.
+
+A ``TreeBlock`` lays its lines out on a fixed character grid: every cell is
+either empty (a space) or holds a copy of one prebuilt glyph path. Glyphs
+are built once per character, font, size and color by a ``GlyphAtlas``, so
+a new line costs a copy per visible character instead of a Pango layout, and
+editing a line only touches the cells whose character changed.
+
+``morph`` turns a block into another state of the same tree: lines are
+matched with ``tree_diff``, so a line that only moved to another row is
+shifted as a whole, and only the glyphs that changed are redrawn.
+
+Every position is arithmetic on a ``MonoGrid``: the center of cell
+(row, col) is the origin plus ``col`` advances right and ``row`` row
+heights down, computed for all of a line's cells at once. Glyphs are placed
+by scaling and shifting their points directly, and blocks are aligned to
+each other by cell corners, so columns line up exactly instead of through
+bounding boxes. The grid follows the block around: two invisible anchor
+points remember where the grid's cells ended up after the block was moved
+or scaled.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from manim import (
+    AnimationGroup,
+    FadeOut,
+    Text,
+    Transform,
+    VectorizedPoint,
+    VGroup,
+)
+
+from tree_diff import diff_lines, glyph_changes
+
+# Full-height glyph used as the vertical reference of a row
+REFERENCE_GLYPH = "│"
+
+_atlases = {}
+
+
+class GlyphAtlas:
+    """One prebuilt path per character, with its offset inside a grid cell."""
+
+    def __init__(self, font="Courier", font_size=16, color="#93a1a1"):
+        self.text_kwargs = {"font": font, "font_size": font_size, "color": color}
+        pair = Text("MM", **self.text_kwargs)
+        self.advance = pair[1].get_center()[0] - pair[0].get_center()[0]
+        self.glyph_height = Text(REFERENCE_GLYPH, **self.text_kwargs).height
+        self.prototypes = {}
+
+    def prototype(self, char):
+        """Return ``(glyph, offset)`` for ``char``, building it on first use."""
+        if char not in self.prototypes:
+            # Lay the character out next to the reference glyph to keep its baseline
+            pair = Text(REFERENCE_GLYPH + char, **self.text_kwargs)
+            glyph = pair[1].copy()
+            offset = np.array([0.0, glyph.get_center()[1] - pair[0].get_center()[1], 0.0])
+            glyph.move_to(np.zeros(3))
+            self.prototypes[char] = (glyph, offset)
+        return self.prototypes[char]
+
+    def glyph(self, char, center, scale=1.0):
+        """Return a copy of ``char`` placed in the cell centered on ``center``."""
+        prototype, offset = self.prototype(char)
+        glyph = prototype.copy()
+        # The prototype is centered on the origin, so placing it is one affine map
+        shift = center + offset * scale
+        for part in glyph.family_members_with_points():
+            part.points = part.points * scale + shift
+        return glyph
+
+
+def glyph_atlas(font="Courier", font_size=16, color="#93a1a1"):
+    """Return the atlas shared by every block with the same font settings."""
+    key = (font, font_size, str(color))
+    if key not in _atlases:
+        _atlases[key] = GlyphAtlas(font, font_size, color)
+    return _atlases[key]
+
+
+@dataclass
+class MonoGrid:
+    """A monospace character grid in scene coordinates."""
+
+    # Center of cell (0, 0)
+    origin: np.ndarray
+    # Distance between the centers of neighbouring columns and rows
+    advance: float
+    row_height: float
+    cell_height: float
+    scale: float = 1.0
+
+    def points(self, rows, cols):
+        """Return the centers of the cells at ``rows`` and ``cols`` as an (n, 3) array."""
+        rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=float), np.asarray(cols, dtype=float))
+        offsets = np.stack([cols * self.advance, -rows * self.row_height, np.zeros_like(rows)], axis=-1)
+        return self.origin + offsets
+
+    def point(self, row, col):
+        return self.points(row, col)
+
+    def corner(self, row, col, direction):
+        """Return the point of cell (row, col) towards ``direction``, e.g. ``UP + LEFT``."""
+        half = np.array([self.advance / 2, self.cell_height / 2, 0.0])
+        return self.point(row, col) + np.asarray(direction) * half
+
+    def row_bottom(self, row):
+        return self.origin[1] - row * self.row_height - self.cell_height / 2
+
+
+class TreeBlock(VGroup):
+    """
+    Lines of monospace text on a fixed character grid.
+
+    ``rows`` holds one ``VGroup`` of glyphs per line and ``lines`` the text
+    they show. Use ``set_line``/``set_char`` to edit single lines,
+    ``append_line`` to grow the block and ``morph`` to turn it into another
+    state of the tree; the edits return animations for the changed cells only.
+    """
+
+    def __init__(self, lines=(), font="Courier", font_size=16, color="#93a1a1", line_buff=0.15, keys=None, **kwargs):
+        super().__init__(**kwargs)
+        self.atlas = glyph_atlas(font, font_size, color)
+        self.row_height = self.atlas.glyph_height + line_buff
+        self.lines = []
+        self.keys = []
+        # Row of every keyed line
+        self.key_rows = {}
+        self.cells = []
+        self.rows = VGroup()
+        self.add(self.rows)
+
+        # The grid before the block is moved or scaled
+        self.base_grid = MonoGrid(np.zeros(3), self.atlas.advance, self.row_height, self.atlas.glyph_height)
+        for text, key in zip(lines, keys or [None] * len(lines)):
+            self._add_row(text, key, self.base_grid)
+
+        # Anchor the grid on two glyphs so it can be recovered after moves
+        glyph_cells = [
+            (row, col) for row, text in enumerate(self.lines)
+            for col, char in enumerate(text) if not char.isspace()
+        ]
+        if len(glyph_cells) < 2:
+            glyph_cells = [(0, 0), (0, 1)]
+        first, last = glyph_cells[0], glyph_cells[-1]
+        self.anchor_cells = (first, last)
+        self.anchors = VGroup(
+            VectorizedPoint(self.base_grid.point(*first)),
+            VectorizedPoint(self.base_grid.point(*last)),
+        )
+        self.add(self.anchors)
+
+    def grid(self):
+        """Return the block's ``MonoGrid``, recovered from the anchors."""
+        start, end = (anchor.get_center() for anchor in self.anchors)
+        grid_start, grid_end = (self.base_grid.point(*cell) for cell in self.anchor_cells)
+        scale = np.linalg.norm(end - start) / np.linalg.norm(grid_end - grid_start)
+        base = self.base_grid
+        return MonoGrid(
+            start - grid_start * scale,
+            base.advance * scale,
+            base.row_height * scale,
+            base.cell_height * scale,
+            scale,
+        )
+
+    def cell_center(self, row, col):
+        return self.grid().point(row, col)
+
+    def cell_corner(self, row, col, direction):
+        return self.grid().corner(row, col, direction)
+
+    def align_cell(self, row, col, point, direction):
+        """Move the block so the ``direction`` corner of cell (row, col) is at ``point``."""
+        return self.shift(np.asarray(point) - self.cell_corner(row, col, direction))
+
+    def subtree(self, key):
+        """Return the rows of the line keyed ``key`` and of the keys nested under it."""
+        start = end = self.key_rows[key]
+        while end < len(self.keys) and self.keys[end][:len(key)] == key:
+            end += 1
+        return self.rows.submobjects[start:end]
+
+    def row_bottom(self, row):
+        """Return the y-coordinate of the bottom of line ``row``'s cells."""
+        return self.grid().row_bottom(row)
+
+    def _build_row(self, text, row, grid):
+        cols = [col for col, char in enumerate(text) if not char.isspace()]
+        centers = grid.points(row, cols)
+        cells = [None] * len(text)
+        for col, center in zip(cols, centers):
+            cells[col] = self.atlas.glyph(text[col], center, grid.scale)
+        return VGroup(*[cells[col] for col in cols]), cells
+
+    def _add_row(self, text, key, grid):
+        group, cells = self._build_row(text, len(self.lines), grid)
+        self.lines.append(text)
+        if key is not None:
+            self.key_rows[key] = len(self.keys)
+        self.keys.append(key)
+        self.cells.append(cells)
+        self.rows.add(group)
+        return group
+
+    def append_line(self, text, key=None):
+        """Add ``text`` as a new last line and return its row of glyphs."""
+        return self._add_row(text, key, self.grid())
+
+    def _edit_cell(self, group, cells, row, col, char, grid):
+        # Morph one cell of a line that stays where it is
+        cells.extend([None] * (col + 1 - len(cells)))
+        old = cells[col]
+        if char.isspace():
+            cells[col] = None
+            group.remove(old)
+            return FadeOut(old)
+
+        target = self.atlas.glyph(char, grid.point(row, col), grid.scale)
+        if old is None:
+            # Fade the new glyph in where it will stay
+            old = target.copy().set_opacity(0)
+            group.add(old)
+        cells[col] = old
+        return Transform(old, target)
+
+    def _move_row(self, group, cells, row, new_row, columns, grid):
+        # Move a whole line to another row, morphing its changed cells on the way
+        shift = grid.point(new_row, 0) - grid.point(row, 0)
+        changed = dict(columns)
+        cells.extend([None] * (max(changed, default=-1) + 1 - len(cells)))
+        targets = {}
+        animations = []
+        for col, old in enumerate(cells):
+            char = changed.get(col)
+            if char is None:
+                if old is not None:
+                    targets[id(old)] = old.copy().shift(shift)
+            elif char.isspace():
+                cells[col] = None
+                group.remove(old)
+                animations.append(FadeOut(old, shift=shift))
+            else:
+                target = self.atlas.glyph(char, grid.point(new_row, col), grid.scale)
+                if old is None:
+                    old = target.copy().shift(-shift).set_opacity(0)
+                    group.add(old)
+                    cells[col] = old
+                targets[id(old)] = target
+        # Glyph by glyph, so a later edit of the row leaves these animations alone
+        animations += [Transform(glyph, targets[id(glyph)]) for glyph in group]
+        return animations
+
+    def set_char(self, row, col, char):
+        """
+        Change the character at (row, col) and return the animation.
+
+        The glyph already in the cell is morphed in place; a glyph written
+        into an empty cell fades in and one replaced by a space fades out.
+        Returns ``None`` when the cell already shows ``char``.
+        """
+        text = self.lines[row].ljust(col + 1)
+        if text[col] == char:
+            return None
+        self.lines[row] = (text[:col] + char + text[col + 1:]).rstrip()
+        return self._edit_cell(self.rows[row], self.cells[row], row, col, char, self.grid())
+
+    def _edit_line(self, row, text):
+        return [self.set_char(row, col, char) for col, char in glyph_changes(self.lines[row], text)]
+
+    def set_line(self, row, text):
+        """Change line ``row`` to ``text``, animating only the cells that differ."""
+        return AnimationGroup(*self._edit_line(row, text))
+
+    def set_lines(self, lines):
+        """Change every line to the matching entry of ``lines`` in one animation."""
+        return AnimationGroup(*[
+            edit for row, text in enumerate(lines) for edit in self._edit_line(row, text)
+        ])
+
+    def morph(self, lines, keys=None):
+        """
+        Turn the block into ``lines`` and return ``(changes, entrances)``.
+
+        Lines are matched with ``diff_lines`` on ``keys`` (or on the text).
+        ``changes`` fade out the removed lines, move the lines that changed
+        row and morph the glyphs that changed; ``entrances`` fade in the new
+        lines where they will stay. Play them in that order to make room
+        before filling it. Unchanged lines are not animated at all.
+        """
+        if keys is not None and None not in self.keys:
+            diff = diff_lines(self.lines, lines, self.keys, keys)
+        else:
+            diff = diff_lines(self.lines, lines)
+        grid = self.grid()
+        groups = list(self.rows)
+        new_groups = [None] * len(lines)
+        new_cells = [None] * len(lines)
+
+        changes = [FadeOut(groups[row]) for row in diff.removed]
+        for row, new_row, columns in diff.kept:
+            group, cells = groups[row], self.cells[row]
+            if row == new_row:
+                changes += [self._edit_cell(group, cells, row, col, char, grid) for col, char in columns]
+            else:
+                changes += self._move_row(group, cells, row, new_row, columns, grid)
+            new_groups[new_row], new_cells[new_row] = group, cells
+
+        entrances = []
+        for new_row, text in diff.inserted:
+            group, cells = self._build_row(text, new_row, grid)
+            targets = [glyph.copy() for glyph in group]
+            group.set_opacity(0)
+            entrances += [Transform(glyph, target) for glyph, target in zip(group, targets)]
+            new_groups[new_row], new_cells[new_row] = group, cells
+
+        self.rows.submobjects = new_groups
+        self.lines = list(lines)
+        self.keys = list(keys) if keys is not None else [None] * len(lines)
+        self.key_rows = {key: row for row, key in enumerate(self.keys) if key is not None}
+        self.cells = new_cells
+        return changes, entrances
@@ -0,0 +1,65 @@
+"""
+Minimal differences between two states of a text tree.
+
+A state is a list of lines, optionally with a key per line (the path of the
+entry it shows). Lines are matched on their keys, or on their text when no
+keys are given, with the longest matching subsequences kept in place, so
+that an insertion above a line moves it instead of replacing it. Matched
+lines report the columns whose character changed; everything else is
+removed or inserted whole.
+"""
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+
+
+@dataclass
+class TreeDiff:
+    # Old row indices of the lines that disappear
+    removed: list = field(default_factory=list)
+    # (new row, text) of the lines that appear
+    inserted: list = field(default_factory=list)
+    # (old row, new row, [(column, char), ...]) of the lines that stay
+    kept: list = field(default_factory=list)
+
+    @property
+    def moved(self):
+        return [(old, new) for old, new, _ in self.kept if old != new]
+
+    @property
+    def changed_glyphs(self):
+        return sum(len(columns) for _, _, columns in self.kept)
+
+    def __bool__(self):
+        return bool(self.removed or self.inserted or self.moved or self.changed_glyphs)
+
+
+def glyph_changes(old, new):
+    """Return ``(column, char)`` for every column where ``new`` differs from ``old``."""
+    width = max(len(old), len(new))
+    return [
+        (column, char)
+        for column, (was, char) in enumerate(zip(old.ljust(width), new.ljust(width)))
+        if was != char
+    ]
+
+
+def diff_lines(old, new, old_keys=None, new_keys=None):
+    """Return the ``TreeDiff`` turning the lines ``old`` into ``new``."""
+    matcher = SequenceMatcher(
+        None,
+        list(old if old_keys is None else old_keys),
+        list(new if new_keys is None else new_keys),
+        autojunk=False,
+    )
+    diff = TreeDiff()
+    for tag, old_start, old_end, new_start, new_end in matcher.get_opcodes():
+        # A replaced run keeps its lines in place as far as both sides go,
+        # so e.g. a renamed entry changes only the glyphs that differ
+        paired = 0 if tag in ("insert", "delete") else min(old_end - old_start, new_end - new_start)
+        for offset in range(paired):
+            old_row, new_row = old_start + offset, new_start + offset
+            diff.kept.append((old_row, new_row, glyph_changes(old[old_row], new[new_row])))
+        diff.removed.extend(range(old_start + paired, old_end))
+        diff.inserted.extend((row, new[row]) for row in range(new_start + paired, new_end))
+    return diff
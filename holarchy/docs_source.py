@@ -0,0 +1,295 @@
+"""
+Levels of a holarchy read from a local documentation source tree.
+
+The tree is a directory of Markdown or reStructuredText (Sphinx) pages. The
+holarchy follows one chain through it, from a word of a sentence of a
+paragraph of a section of a page up to the whole site, and shows a few
+siblings of every node on the way.
+
+Nothing is read whole. Pages are found by walking the tree lazily and files
+are parsed line by line into headings and paragraphs as they are read. Each
+node's children are picked by reservoir sampling, which keeps at most
+``sample`` of them, uniformly and in document order, in a single pass. A
+site of 10,000 pages costs the same handful of file reads and renders the
+same levels as a small one.
+"""
+
+import os
+import random
+import re
+import textwrap
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from levels import Level
+
+PAGE_SUFFIXES = (".md", ".markdown", ".rst", ".txt")
+# Directories that hold build output, themes or dependencies rather than pages
+SKIP_DIRS = {"_build", "_static", "_templates", "build", "node_modules", "venv"}
+# Docs directories named for what they hold rather than the project
+GENERIC_DIRS = {"doc", "docs", "documentation", "source", "content", "src"}
+
+DEFAULT_SAMPLE = 32
+# Longest labels of parents and children, in characters, before they are shortened
+MAX_LABEL = 24
+MAX_CHILD_LABEL = 14
+
+# Lines made of one repeated punctuation character underline (or overline)
+# reStructuredText and Markdown setext headings
+ADORNMENT = re.compile(r"^([=\-`:'\"~^_*+#<>.])\1+\s*$")
+ATX_HEADING = re.compile(r"^#{1,6}\s+(.*?)\s*#*\s*$")
+FENCE = re.compile(r"^\s*(```|~~~)")
+SPHINX_PROJECT = re.compile(r"^project\s*=\s*['\"](.+)['\"]")
+LIST_MARKER = re.compile(r"^\s*(?:[-*+]|\d+[.)]|#\.)\s+")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[\"'(\[]?[A-Z0-9])")
+WORD = re.compile(r"[A-Za-z0-9][\w'’-]*")
+
+# Inline markup, replaced by the text it marks up
+INLINE = [
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),  # Markdown images
+    (re.compile(r"\[([^\]]+)\]\([^)]*\)"), r"\1"),  # Markdown links
+    (re.compile(r":[\w:+-]+:`([^`<]*?)\s*(?:<[^>]*>)?`"), r"\1"),  # Sphinx roles
+    (re.compile(r"`([^`<]*?)\s*<[^>]*>`_{1,2}"), r"\1"),  # reStructuredText links
+    (re.compile(r"[*`]+|(?<!\w)_{1,2}|_{1,2}(?!\w)"), ""),  # Emphasis and literals
+]
+
+
+class Reservoir:
+    """Up to ``size`` items offered one at a time, each kept with the same chance."""
+
+    def __init__(self, size, rng):
+        self.size = size
+        self.rng = rng
+        self.seen = 0
+        self.slots = []
+
+    def offer(self, item):
+        """Offer ``item``, returning whether it was kept (for now)."""
+        index, self.seen = self.seen, self.seen + 1
+        if index < self.size:
+            self.slots.append((index, item))
+            return True
+        slot = self.rng.randrange(index + 1)
+        if slot < self.size:
+            self.slots[slot] = (index, item)
+            return True
+        return False
+
+    def items(self):
+        """Return the kept items in the order they were offered."""
+        return [item for _, item in sorted(self.slots, key=lambda slot: slot[0])]
+
+
+@dataclass
+class Section:
+    title: str
+    paragraphs: Reservoir = None
+
+
+@dataclass
+class Page:
+    path: Path
+    title: str = None
+    sections: list = field(default_factory=list)
+
+
+def iter_pages(root):
+    """Yield the path of every page under ``root``, in a stable order, while walking the tree."""
+    with os.scandir(root) as entries:
+        entries = sorted(entries, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir():
+            if entry.name not in SKIP_DIRS:
+                yield from iter_pages(entry.path)
+        elif entry.name.endswith(PAGE_SUFFIXES):
+            yield Path(entry.path)
+
+
+def clean(text):
+    """Return ``text`` without its inline markup and with its whitespace collapsed."""
+    for pattern, replacement in INLINE:
+        text = pattern.sub(replacement, text)
+    return " ".join(text.split())
+
+
+def iter_blocks(path):
+    """Yield ``("heading", text)`` and ``("paragraph", text)`` from the page at ``path`` as it is read."""
+    lines = []
+    fence = None
+    skip_indented = False
+    with open(path, encoding="utf-8", errors="replace") as file:
+        for number, line in enumerate(file):
+            line = line.rstrip()
+            stripped = line.strip()
+
+            # Front matter, fenced code, and the bodies of directives and
+            # literal blocks are not prose
+            if number == 0 and stripped == "---":
+                fence = "---"
+                continue
+            if fence is not None:
+                if stripped.startswith(fence):
+                    fence = None
+                elif fence == "---" and stripped.startswith("title:"):
+                    yield "heading", clean(stripped[len("title:"):].strip(" \"'"))
+                continue
+            match = FENCE.match(line)
+            if match:
+                fence = match.group(1)
+                continue
+            if skip_indented:
+                if not stripped or line[0].isspace():
+                    continue
+                skip_indented = False
+
+            # Adornments turn the line above into a heading, or precede one
+            if ADORNMENT.match(stripped) and len(stripped) >= 3:
+                if len(lines) == 1:
+                    yield "heading", clean(lines.pop())
+                elif lines:
+                    yield "paragraph", clean(" ".join(lines))
+                    lines = []
+                continue
+
+            match = ATX_HEADING.match(stripped)
+            if not stripped or match or stripped.startswith(("..", "<", "|", "+-")) or (line[0].isspace() and not lines):
+                if lines:
+                    paragraph = " ".join(lines)
+                    lines = []
+                    yield "paragraph", clean(paragraph)
+                    skip_indented = paragraph.endswith("::")
+                if match:
+                    yield "heading", clean(match.group(1))
+                elif stripped.startswith(".."):
+                    skip_indented = True
+                continue
+            lines.append(LIST_MARKER.sub("", line))
+    if lines:
+        yield "paragraph", clean(" ".join(lines))
+
+
+def _title_from_name(path):
+    return path.stem.replace("_", " ").replace("-", " ")
+
+
+def read_title(path):
+    """Return the first heading of the page at ``path``, reading no further than it."""
+    for kind, text in iter_blocks(path):
+        if kind == "heading" and text:
+            return text
+    return _title_from_name(path)
+
+
+def site_name(root):
+    """Return the Sphinx project name of the docs under ``root``, or the name of their directory."""
+    conf = root / "conf.py"
+    if conf.is_file():
+        with open(conf, encoding="utf-8", errors="replace") as file:
+            for line in file:
+                match = SPHINX_PROJECT.match(line)
+                if match:
+                    return match.group(1)
+    for directory in (root, *root.parents):
+        if directory.name.lower() not in GENERIC_DIRS:
+            return directory.name or str(directory)
+    return root.name
+
+
+def read_page(path, sample, rng):
+    """Return the page at ``path`` with a sample of its sections and of their paragraphs."""
+    page = Page(path)
+    sections = Reservoir(sample, rng)
+    section = None
+    for kind, text in iter_blocks(path):
+        if kind == "heading":
+            page.title = page.title or text
+            section = Section(text, Reservoir(sample, rng))
+            if not sections.offer(section):
+                section = None
+        elif section is not None or sections.seen == 0:
+            if section is None:
+                # Text before the first heading goes in an untitled section
+                section = Section(None, Reservoir(sample, rng))
+                sections.offer(section)
+            if split_sentences(text):
+                section.paragraphs.offer(text)
+    page.title = page.title or _title_from_name(path)
+    page.sections = [section for section in sections.items() if section.paragraphs.seen]
+    return page
+
+
+def split_sentences(paragraph):
+    return [sentence for sentence in SENTENCE_END.split(paragraph) if WORD.search(sentence)]
+
+
+def shorten(text, limit=MAX_LABEL):
+    """Return ``text`` cut down to ``limit`` characters at a word boundary."""
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    short = textwrap.shorten(text, limit - 1, placeholder="")
+    return (short or text[:limit - 1]) + "…"
+
+
+def middle_out(items):
+    """Yield the indices of ``items``, starting from the middle and alternating outward."""
+    middle = (len(items) - 1) // 2
+    for step in range(len(items)):
+        yield middle + (step + 1) // 2 * (1 if step % 2 else -1)
+
+
+def window(labels, focus, fanout):
+    """Return the labels within ``fanout`` - 1 of ``focus``, and where ``focus`` is among them."""
+    start = max(focus - fanout + 1, 0)
+    return labels[start:focus + fanout], focus - start
+
+
+def read_levels(root, fanout=4, sample=DEFAULT_SAMPLE, seed=0):
+    """
+    Return the levels of the holarchy of the docs under ``root``, from a word up to the site.
+
+    Every node's children are a sample of at most ``sample``; the chain goes
+    through the one nearest the middle that has children of its own. The
+    sampling is seeded, so the same tree always gives the same levels.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    pages = Reservoir(sample, rng)
+    for path in iter_pages(root):
+        pages.offer(path)
+    paths = pages.items()
+    if not paths:
+        raise ValueError(f"no pages ({', '.join(PAGE_SUFFIXES)}) under {root}")
+
+    # Walk down the chain from the page nearest the middle that has any text
+    for page_focus in middle_out(paths):
+        page = read_page(paths[page_focus], sample, rng)
+        if page.sections:
+            break
+    else:
+        raise ValueError(f"no text in the pages under {root}")
+    section_focus = next(middle_out(page.sections))
+    section = page.sections[section_focus]
+    paragraphs = section.paragraphs.items()
+    paragraph_focus = next(middle_out(paragraphs))
+    sentences = split_sentences(paragraphs[paragraph_focus])
+    sentence_focus = next(middle_out(sentences))
+    words = WORD.findall(sentences[sentence_focus])
+
+    titles = [page.title if index == page_focus else read_title(path) for index, path in enumerate(paths)]
+    headings = [heading or page.title for heading in (section.title for section in page.sections)]
+    chain = [
+        ("sentence", sentences[sentence_focus], words, None),
+        ("paragraph", paragraphs[paragraph_focus], sentences, sentence_focus),
+        ("section", headings[section_focus], paragraphs, paragraph_focus),
+        ("page", page.title, headings, section_focus),
+        ("docs site", site_name(root.resolve()), titles, page_focus),
+    ]
+    levels = [Level("word")]
+    for kind, label, children, focus in chain:
+        if focus is not None:
+            children, focus = window(children, focus, fanout)
+        levels.append(Level(kind, shorten(label), [shorten(child, MAX_CHILD_LABEL) for child in children], focus))
+    return levels
@@ -0,0 +1,112 @@
+"""
+Layout of a holarchy, worked out once for every level.
+
+Each level of the animation looks the same: ``fanout`` children in a row at
+the bottom, an org-chart connector rising from them, and their parent above.
+Zooming out shrinks the picture by the ratio of the two font sizes and moves
+it so the parent lands in one of the child slots of the next level, which
+then looks exactly like the previous one did. ``HolarchyLayout`` computes
+those positions up front as tables indexed by slot and level, so building
+any level is a lookup however deep the holarchy goes. The landing slots
+repeat, so the level tables do too, and ``row`` wraps levels past their end.
+
+What a level shows is a ``Level``: the label of its parent and the labels of
+its children in order, one of which is the previous level's parent.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from manimations.segments import Segments
+
+CHILD_Y = -1
+PARENT_Y = 1
+# Height of the horizontal bar of the connectors
+BUS_Y = 0.05
+# Gaps between the connectors and the text they join
+CHILD_CLEARANCE = 0.2
+PARENT_CLEARANCE = 0.3
+
+CONNECTOR_COLOR = "#93a1a1"
+CONNECTOR_WIDTH = 2
+
+# Child slot each zoomed-out parent lands in, cycled from the first zoom on
+DEFAULT_LANDING = (1, 2, 0)
+
+
+@dataclass
+class Level:
+    kind: str
+    label: str = None
+    children: list = field(default_factory=list)
+    # Index in children of the previous level's parent, which is already shown
+    focus: int = None
+    color: object = None
+
+
+class HolarchyLayout:
+    def __init__(self, depth, fanout=4, spacing=1.8, child_font_size=24, parent_font_size=36, landing=DEFAULT_LANDING):
+        self.depth = depth
+        self.fanout = fanout
+        self.child_font_size = child_font_size
+        self.parent_font_size = parent_font_size
+        # Widest a label may be before it is shrunk to fit
+        self.child_width = 0.9 * spacing
+        self.parent_width = (fanout - 1) * spacing
+
+        # Where the children of every level sit, centered under the parent
+        xs = (np.arange(fanout) - (fanout - 1) / 2) * spacing
+        self.child_points = np.stack([xs, np.full(fanout, CHILD_Y), np.zeros(fanout)], axis=1)
+        self.parent_point = np.array([0.0, PARENT_Y, 0.0])
+
+        # Zooming past level k scales about the origin, then shifts its parent
+        # onto child slot landing[k] of level k + 1
+        self.zoom_scale = child_font_size / parent_font_size
+        self.period = len(landing)
+        rows = max(depth, self.period + 1)
+        self.landing = np.array([0] + [landing[(k - 1) % self.period] % fanout for k in range(1, rows)])
+        self.zoom_shifts = self.child_points[self.landing] - self.parent_point * self.zoom_scale
+
+        # Connector endpoints, the same at every level
+        self.riser_starts = self.child_points + [0, CHILD_CLEARANCE, 0]
+        self.riser_ends = self.child_points * [1, 0, 1] + [0, BUS_Y, 0]
+        self.bus_center = np.array([0.0, BUS_Y, 0.0])
+        self.stem_end = self.parent_point - [0, PARENT_CLEARANCE, 0]
+
+        # The connector's segments, drawn bottom to top: the risers, then the
+        # two halves of the bar meeting in the middle, then the stem
+        self.connector_starts = np.concatenate([self.riser_starts, self.riser_ends[[0, -1]], [self.bus_center]])
+        self.connector_ends = np.concatenate([self.riser_ends, [self.bus_center] * 2, [self.stem_end]])
+        self.connector_stages = np.array([0] * fanout + [1, 1, 2])
+
+    def row(self, level):
+        """Row of the level tables for level ``level``, however deep it is."""
+        return (level - 1) % self.period + 1 if level > 0 else 0
+
+    def child_labels(self, level, content):
+        """
+        Return ``(slot, label)`` for the new children of level ``level``, showing ``content``.
+
+        The children keep their order around the previous level's parent,
+        which has landed in its slot already; those that do not fit are left out.
+        """
+        if content.focus is None:
+            return list(enumerate(content.children[:self.fanout]))
+        offset = self.landing[self.row(level - 1)] - content.focus
+        return [
+            (index + offset, label) for index, label in enumerate(content.children)
+            if index != content.focus and 0 <= index + offset < self.fanout
+        ]
+
+    def connector(self, segments=None):
+        """
+        Return the org-chart lines joining the children to the parent, as one ``Segments``.
+
+        Pass an earlier connector to lay it out again instead. Grow it with
+        ``GrowSegments(connector, stages=layout.connector_stages)``.
+        """
+        if segments is None:
+            segments = Segments(stroke_color=CONNECTOR_COLOR)
+        segments.set_segments(self.connector_starts, self.connector_ends)
+        return segments.set_stroke(width=CONNECTOR_WIDTH)
@@ -0,0 +1,143 @@
+"""
+Level of detail for content that has zoomed out of sight.
+
+After a few zooms the first levels are a few pixels tall, yet every bezier
+of every glyph is still rasterized on every frame. ``LevelOfDetail`` tracks
+how tall each registered mobject is on screen and, whenever the camera
+moves, swaps the ones below ``min_pixels`` for a flat bar of the same size
+and color, and drops them altogether below ``cull_pixels``.
+
+Swapping works on point arrays: a hidden mobject keeps its submobjects but
+lends their points to the side, and a bar that is not shown has none. Both
+stay in the scene, so the swap can happen in the middle of an animation and
+no mobject is ever copied. Registered mobjects must keep still, except
+that ``rebase`` moves all of them at once; ``release`` hands one back whole
+and keeps its bar for the next mobject registered.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from manim import Rectangle, VGroup, config
+
+FULL, BAR, HIDDEN = 0, 1, 2
+
+# Bar height as a fraction of the text it stands in for
+BAR_HEIGHT = 0.4
+BAR_OPACITY = 0.6
+
+
+@dataclass
+class Detail:
+    mobject: object
+    leaves: list
+    points: list
+    bar: object = None
+    bar_points: object = None
+
+
+def _hide(mobjects):
+    for mobject in mobjects:
+        mobject.points = np.zeros((0, 3))
+
+
+class LevelOfDetail(VGroup):
+    """The bars of the registered mobjects, to be added to the scene once."""
+
+    def __init__(self, min_pixels=6, cull_pixels=1, **kwargs):
+        super().__init__(**kwargs)
+        self.min_pixels = min_pixels
+        self.cull_pixels = cull_pixels
+        self.details = []
+        self.sizes = np.zeros(0)
+        self.has_bar = np.zeros(0, dtype=bool)
+        self.states = np.zeros(0, dtype=int)
+        # Bars of released mobjects with the points they had, to be reshaped for new ones
+        self.free_bars = []
+
+    def register(self, mobject, size=None, bar=True):
+        """
+        Track ``mobject``, whose on-screen size is that of ``size`` scene units.
+
+        ``size`` defaults to the mobject's height. With ``bar=False`` the
+        mobject is dropped below ``min_pixels`` instead of turning into a bar.
+        """
+        leaves = mobject.family_members_with_points()
+        detail = Detail(mobject, leaves, [leaf.points for leaf in leaves])
+        if bar:
+            if self.free_bars:
+                detail.bar, points = self.free_bars.pop()
+                detail.bar.points = points
+                detail.bar.stretch_to_fit_width(mobject.width).stretch_to_fit_height(mobject.height * BAR_HEIGHT)
+                detail.bar.set_fill(mobject.get_color()).move_to(mobject)
+            else:
+                detail.bar = Rectangle(
+                    width=mobject.width,
+                    height=mobject.height * BAR_HEIGHT,
+                    stroke_width=0,
+                    fill_color=mobject.get_color(),
+                    fill_opacity=BAR_OPACITY,
+                ).move_to(mobject)
+                self.add(detail.bar)
+            detail.bar_points = detail.bar.points
+            _hide([detail.bar])
+        self.details.append(detail)
+        self.sizes = np.append(self.sizes, mobject.height if size is None else size)
+        self.has_bar = np.append(self.has_bar, bar)
+        self.states = np.append(self.states, FULL)
+        return mobject
+
+    def _index(self, mobject):
+        return next(index for index, detail in enumerate(self.details) if detail.mobject is mobject)
+
+    def hidden(self, mobject):
+        """Whether registered ``mobject`` is currently culled."""
+        return self.states[self._index(mobject)] == HIDDEN
+
+    def release(self, mobject):
+        """Stop tracking registered ``mobject`` and give it back its points."""
+        index = self._index(mobject)
+        detail = self.details.pop(index)
+        for leaf, points in zip(detail.leaves, detail.points):
+            leaf.points = points
+        if detail.bar is not None:
+            _hide([detail.bar])
+            self.free_bars.append((detail.bar, detail.bar_points))
+        self.sizes = np.delete(self.sizes, index)
+        self.has_bar = np.delete(self.has_bar, index)
+        self.states = np.delete(self.states, index)
+        return mobject
+
+    def rebase(self, scale, shift):
+        """Map every registered mobject, shown or not, through ``point * scale + shift``."""
+        for detail, state in zip(self.details, self.states):
+            detail.points = [points * scale + shift for points in detail.points]
+            for leaf, points in zip(detail.leaves, detail.points):
+                if state == FULL:
+                    leaf.points = points
+            if detail.bar is not None:
+                detail.bar_points = detail.bar_points * scale + shift
+                if state == BAR:
+                    detail.bar.points = detail.bar_points
+        self.sizes = self.sizes * scale
+
+    def update_view(self, frame):
+        """Show every registered mobject in the detail its size in ``frame`` calls for."""
+        pixels = self.sizes * config.pixel_height / frame.height
+        states = np.where(
+            pixels >= self.min_pixels, FULL,
+            np.where(self.has_bar & (pixels >= self.cull_pixels), BAR, HIDDEN),
+        )
+        for index in np.flatnonzero(states != self.states):
+            detail = self.details[index]
+            if states[index] == FULL:
+                for leaf, points in zip(detail.leaves, detail.points):
+                    leaf.points = points
+            else:
+                _hide(detail.leaves)
+            if detail.bar is not None:
+                if states[index] == BAR:
+                    detail.bar.points = detail.bar_points
+                else:
+                    _hide([detail.bar])
+        self.states = states
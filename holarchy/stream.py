@@ -0,0 +1,117 @@
+"""
+An endless holarchy in constant memory.
+
+Zooming out level after level would pile up mobjects that are all kept for
+good, long after they have shrunk to nothing. By then the level of detail
+(see lod.py) has culled them; ``LevelStream`` goes on to retire the level:
+its mobjects leave the scene for a pool, and the next label of the same
+name or connector is taken from there instead of being built. The pool
+keeps a few labels of every name and only so many in all, forgetting the
+ones retired longest ago, so labels that never come back (e.g. the words
+of a docs tree) do not pile up there instead. Only the levels still in
+sight and the pool exist at any time.
+
+Coordinates stay bounded the same way. The camera zooms out as before, and
+once a level is shown ``rebase`` moves everything still around to where
+the unzoomed camera shows it the same and puts the camera back, so the
+picture never drifts off toward huge coordinates however long it runs.
+"""
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from manimations.text import cached_text
+
+# Retired labels kept for reuse, of any one name and size and in all
+MAX_FREE_PER_LABEL = 8
+MAX_FREE_TEXTS = 64
+
+
+@dataclass
+class ShownLevel:
+    # The mobjects showing a level (see levels.Level for its content)
+    texts: list
+    connector: object = None
+
+
+class LevelStream:
+    def __init__(self, layout, view, lod):
+        self.layout = layout
+        self.view = view
+        self.lod = lod
+        self.levels = deque()
+        # Retired labels by name, size and color, least recently retired first, and retired connectors
+        self.free_texts = OrderedDict()
+        self.free_connectors = []
+        # How many labels and connectors had to be built rather than recycled
+        self.built = 0
+
+    def text(self, name, font_size, color, point, width=None):
+        """
+        Return a ``name`` label laid out at screen point ``point``, recycled if one is free.
+
+        Labels wider than ``width`` are shrunk to fit.
+        """
+        key = (name, font_size, str(color), width)
+        if key in self.free_texts:
+            free = self.free_texts[key]
+            text = free.pop()
+            if not free:
+                del self.free_texts[key]
+            text.scale(text.screen_height / text.height)
+        else:
+            text = cached_text(name, font_size=font_size, color=color)
+            if width is not None and text.width > width:
+                text.scale_to_fit_width(width)
+            text.pool_key, text.screen_height = key, text.height
+            self.built += 1
+        return self.view.place(text.move_to(point))
+
+    def connector(self):
+        """Return a connector placed for the camera, recycled if one is free."""
+        connector = self.free_connectors.pop() if self.free_connectors else None
+        if connector is None:
+            self.built += 1
+        return self.view.place(self.layout.connector(connector))
+
+    def add(self, texts, connector=None, parent=None):
+        """Track a level once it is shown: its new labels, and the connector leading to ``parent``."""
+        for text in texts:
+            self.lod.register(text)
+        level = ShownLevel(list(texts))
+        if connector is not None:
+            # The lines go when the parent they lead to becomes a bar
+            level.connector = self.lod.register(connector, size=parent.height, bar=False)
+        self.levels.append(level)
+
+    def retire(self):
+        """Retire the oldest levels once they are culled, returning the mobjects to take off the scene."""
+        retired = []
+        while self.levels and all(self.lod.hidden(text) for text in self.levels[0].texts):
+            level = self.levels.popleft()
+            for text in level.texts:
+                self.free_text(self.lod.release(text))
+            retired += level.texts
+            if level.connector is not None:
+                self.free_connectors.append(self.lod.release(level.connector))
+                retired.append(level.connector)
+        return retired
+
+    def free_text(self, text):
+        """Keep retired ``text`` for the next label like it, within the limits of the pool."""
+        free = self.free_texts.setdefault(text.pool_key, [])
+        self.free_texts.move_to_end(text.pool_key)
+        if len(free) < MAX_FREE_PER_LABEL:
+            free.append(text)
+        else:
+            self.view.forget(text)
+        while sum(map(len, self.free_texts.values())) > MAX_FREE_TEXTS:
+            key, oldest = next(iter(self.free_texts.items()))
+            self.view.forget(oldest.pop(0))
+            if not oldest:
+                del self.free_texts[key]
+
+    def rebase(self):
+        """Move every level to screen coordinates and put the camera back, changing nothing on screen."""
+        self.lod.rebase(self.view.scale, self.view.shift)
+        self.view.reset()
@@ -0,0 +1,81 @@
+"""
+Zooming out by moving the camera instead of the picture.
+
+Shrinking the picture with ``.animate.scale(...).shift(...)`` rewrites the
+points of everything on screen on every frame of every zoom. A ``ZoomView``
+leaves the mobjects where they are and moves the camera frame instead, so a
+zoom costs one rectangle transform per frame however much is on screen.
+
+The view keeps the map from scene to screen coordinates, ``screen = scale *
+point + shift``, that all zooms so far add up to. New mobjects are laid out
+in screen coordinates as before and ``place`` moves them to where the
+camera shows them that way. Stroke widths are the exception: scaling the
+picture left them alone, so the view sets the width of every stroke it
+placed whenever the camera moves, and lines keep their width on screen.
+"""
+
+import numpy as np
+from manim import ORIGIN, UpdateFromAlphaFunc
+
+
+class ZoomView:
+    def __init__(self, frame):
+        self.frame = frame
+        self.frame_width = frame.width
+        self.scale = 1.0
+        self.shift = np.zeros(3)
+        # The stroked leaves placed so far, with their widths on screen, by id
+        self.strokes = {}
+        # Called with the frame whenever it moves, e.g. to adapt the level of detail
+        self.listeners = []
+
+    def to_scene(self, point):
+        """Return the scene point shown at screen point ``point``."""
+        return (np.asarray(point) - self.shift) / self.scale
+
+    def place(self, mobject):
+        """Move ``mobject``, laid out in screen coordinates, to where the camera shows it so."""
+        mobject.scale(1 / self.scale, about_point=ORIGIN).shift(-self.shift / self.scale)
+        for leaf in mobject.family_members_with_points():
+            # A recycled leaf keeps the width it was first placed with
+            if id(leaf) not in self.strokes and leaf.get_stroke_width():
+                self.strokes[id(leaf)] = (leaf, leaf.get_stroke_width())
+            if id(leaf) in self.strokes:
+                leaf.set_stroke(width=self.strokes[id(leaf)][1] / self.scale, family=False)
+        return mobject
+
+    def forget(self, mobject):
+        """Stop keeping the strokes of ``mobject``, once it is gone for good."""
+        for leaf in mobject.get_family():
+            self.strokes.pop(id(leaf), None)
+
+    def _frame_for(self, scale, shift):
+        self.frame.set_width(self.frame_width / scale)
+        self.frame.move_to(-shift / scale)
+        for leaf, width in self.strokes.values():
+            leaf.set_stroke(width=width / scale, family=False)
+        for listener in self.listeners:
+            listener(self.frame)
+
+    def zoom(self, scale, shift, **kwargs):
+        """
+        Return the camera animation of ``picture.scale(scale, about_point=ORIGIN).shift(shift)``.
+
+        Every frame matches what animating the picture itself would show,
+        with the scale and shift interpolated in screen space.
+        """
+        start_scale, start_shift = self.scale, self.shift
+        self.scale = start_scale * scale
+        self.shift = start_shift * scale + shift
+
+        def update(frame, alpha):
+            factor = 1 + (scale - 1) * alpha
+            self._frame_for(start_scale * factor, start_shift * factor + shift * alpha)
+
+        return UpdateFromAlphaFunc(self.frame, update, **kwargs)
+
+    def reset(self):
+        """Put the camera back, once what it showed has been moved to screen coordinates."""
+        self.scale = 1.0
+        self.shift = np.zeros(3)
+        self._frame_for(self.scale, self.shift)
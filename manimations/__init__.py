@@ -0,0 +1,7 @@
+"""
+Shared helpers for the manimations collection.
+
+The scenes themselves live in their own project directories (``holarchy/``,
+``docs-deploy/``, ...). This package holds the tooling used to render them
+and the pieces that more than one scene needs.
+"""
@@ -0,0 +1,25 @@
+"""
+Pieces shared by the animations that work on arrays.
+
+``AnimateParticles``, ``GrowSegments`` and the like keep what they animate
+in NumPy arrays and set their mobject from those on every frame. They need
+a rate function evaluated on many values at once, and they have no use for
+the starting copy of the mobject that ``Animation.begin`` makes.
+"""
+
+import numpy as np
+
+# Samples of a rate function, for evaluating it on many values at once
+RATE_SAMPLES = np.linspace(0, 1, 1025)
+
+
+def rate_table(rate_func):
+    """Return ``rate_func`` at ``RATE_SAMPLES``, to look values up with ``np.interp(values, RATE_SAMPLES, table)``."""
+    return np.array([rate_func(t) for t in RATE_SAMPLES])
+
+
+class NoStartingCopy:
+    """Mixin for animations that set their mobject from state of their own, so they need no starting copy of it."""
+
+    def create_starting_mobject(self):
+        return self.mobject
@@ -0,0 +1,187 @@
+"""
+Render benchmarks across quality presets.
+
+Each scene is rendered once per preset, one at a time so the measurements do
+not compete for cores, with both the segment cache and manim's own partial
+movie cache disabled. Every run is appended to a JSON history file and can be
+compared against a stored baseline, failing when a scene got slower (or
+hungrier) than the allowed threshold.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import time
+from pathlib import Path
+
+from manimations.launch import NO_CACHE_ENV
+from manimations.render import PROJECT_ROOT, render_scene
+
+BENCH_DIR = PROJECT_ROOT / "benchmarks"
+DEFAULT_HISTORY = BENCH_DIR / "history.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# Media directory for benchmark renders, kept apart from normal output
+BENCH_MEDIA_DIR = PROJECT_ROOT / "media" / "bench"
+
+DEFAULT_QUALITIES = ("l", "m", "h")
+
+# Metrics compared against the baseline, where a higher value is worse
+REGRESSION_METRICS = ("wall_time", "peak_rss")
+
+
+def count_frames(path):
+    """Return the number of video frames in ``path``."""
+    import av
+
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        if stream.frames:
+            return stream.frames
+        # Some containers do not store a frame count; derive it from the
+        # duration of the stream, or else of the container (e.g. WebM)
+        rate = stream.average_rate or stream.guessed_rate
+        if rate:
+            if stream.duration is not None:
+                return round(float(stream.duration * stream.time_base * rate))
+            if container.duration is not None:
+                return round(float(container.duration / av.time_base * rate))
+        # Nothing to go by but the frames themselves
+        return sum(1 for _ in container.decode(stream))
+
+
+def _find_bench_output(spec):
+    candidates = [
+        path for path in (BENCH_MEDIA_DIR / "videos").rglob(f"{spec.name}.*")
+        if "partial_movie_files" not in path.parts
+    ]
+    return max(candidates, key=lambda path: path.stat().st_mtime, default=None)
+
+
+def bench_scene(spec, quality):
+    """Render ``spec`` at ``quality`` from scratch and measure it."""
+    extra_args = ["--disable_caching", "--media_dir", str(BENCH_MEDIA_DIR)]
+    result = render_scene(spec, quality, extra_args, env={NO_CACHE_ENV: "1"})
+
+    record = {
+        "scene": spec.name,
+        "quality": quality,
+        "returncode": result.returncode,
+        "wall_time": round(result.wall_time, 3),
+        "peak_rss": result.peak_rss,
+        "frames": None,
+        "fps": None,
+        "output_bytes": None,
+    }
+    output = _find_bench_output(spec)
+    if result.ok and output is not None:
+        record["frames"] = count_frames(output)
+        record["fps"] = round(record["frames"] / result.wall_time, 2)
+        record["output_bytes"] = output.stat().st_size
+    return record, result
+
+
+def run_benchmarks(specs, qualities=DEFAULT_QUALITIES, on_record=None):
+    """Benchmark every scene at every quality and return the run as a dict."""
+    records = []
+    for spec in specs:
+        for quality in qualities:
+            record, result = bench_scene(spec, quality)
+            records.append(record)
+            if on_record is not None:
+                on_record(record, result)
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": _git_commit(),
+        "machine": {
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "results": records,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def append_history(run, path=DEFAULT_HISTORY):
+    """Append ``run`` to the JSON history file at ``path``."""
+    path = Path(path)
+    history = json.loads(path.read_text(encoding="utf-8")) if path.exists() else []
+    history.append(run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + "\n", encoding="utf-8")
+
+
+def save_baseline(run, path=DEFAULT_BASELINE):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(run, indent=2) + "\n", encoding="utf-8")
+
+
+def load_baseline(path=DEFAULT_BASELINE):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(run, baseline, threshold=0.15):
+    """
+    Compare ``run`` against ``baseline``.
+
+    Returns one row per (scene, quality, metric) present in both, with the
+    relative change and whether it exceeds ``threshold``.
+    """
+    previous = {(r["scene"], r["quality"]): r for r in baseline["results"]}
+    rows = []
+    for record in run["results"]:
+        base = previous.get((record["scene"], record["quality"]))
+        if base is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            old, new = base.get(metric), record.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            rows.append({
+                "scene": record["scene"],
+                "quality": record["quality"],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": change,
+                "regression": change > threshold,
+            })
+    return rows
+
+
+def format_comparison(rows, threshold):
+    lines = [f"{'scene':<26} {'q':<2} {'metric':<10} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['scene']:<26} {row['quality']:<2} {row['metric']:<10} "
+            f"{_format_metric(row['metric'], row['baseline']):>12} "
+            f"{_format_metric(row['metric'], row['current']):>12} "
+            f"{row['change']:>+8.1%}{flag}"
+        )
+    regressions = sum(row["regression"] for row in rows)
+    lines.append(f"{regressions} regression(s) above {threshold:.0%}")
+    return "\n".join(lines)
+
+
+def _format_metric(metric, value):
+    if metric == "peak_rss":
+        return f"{value / 1024 / 1024:.0f} MB"
+    return f"{value:.2f}s"
@@ -0,0 +1,293 @@
+"""
+Content-addressed cache of rendered animation segments.
+
+Manim already names every partial movie file after a hash of the play call
+(camera, animations and mobject state), but those files live in each media
+directory and are thrown away by count. This cache extends that key with the
+render config, the source of the ``play``/``wait`` statement and the source
+of the project modules the scene has loaded, and keeps the segments in one
+persistent store shared by every scene, quality and section process. The
+store is trimmed to a byte budget, least recently used first, and every
+lookup is logged so that hit rates can be reported.
+
+Manim's hash covers what the mobjects and animations hold, not what their
+code does with it: editing ``interpolate_mobject`` of an animation class, or
+a helper method of the scene, would leave it unchanged. Hence the module
+sources in the key.
+
+The cache is wired into manim by ``install``, which ``manimations.launch``
+calls inside each render process.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from manimations.callsite import call_site, statement_source
+from manimations.render import PROJECT_ROOT
+
+# Environment variables that configure the cache in render processes
+CACHE_DIR_ENV = "MANIMATIONS_CACHE_DIR"
+CACHE_MAX_MB_ENV = "MANIMATIONS_CACHE_MAX_MB"
+
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".cache" / "render"
+DEFAULT_MAX_MB = 2048
+
+# The render tooling itself, which never changes what a segment looks like
+TOOLING_MODULES = {
+    "manimations.bench",
+    "manimations.cache",
+    "manimations.callsite",
+    "manimations.launch",
+    "manimations.render",
+    "manimations.trace",
+}
+
+
+class RenderCache:
+    """A directory of segment videos named after their content key."""
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.objects = self.root / "objects"
+        self.log_path = self.root / "events.log"
+
+    @classmethod
+    def from_env(cls):
+        root = os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+        max_mb = float(os.environ.get(CACHE_MAX_MB_ENV) or DEFAULT_MAX_MB)
+        return cls(root, int(max_mb * 1024 * 1024))
+
+    def path_for(self, key, suffix):
+        # Fan out over subdirectories so no single directory grows huge
+        return self.objects / key[:2] / f"{key}{suffix}"
+
+    def get(self, key, suffix):
+        """Return the stored segment for ``key``, marking it as recently used."""
+        path = self.path_for(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.record("miss", key)
+            return None
+        self.record("hit", key)
+        return path
+
+    def fetch(self, key, target):
+        """Copy the segment for ``key`` to ``target``. Returns whether it was found."""
+        target = Path(target)
+        path = self.get(key, target.suffix)
+        if path is None:
+            return False
+        try:
+            _atomic_copy(path, target)
+        except FileNotFoundError:
+            # Evicted by another process between the lookup and the copy
+            return False
+        return True
+
+    def put(self, key, source):
+        """Store the file at ``source`` under ``key`` and trim the cache."""
+        source = Path(source)
+        path = self.path_for(key, source.suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            _atomic_copy(source, path)
+            self.record("store", key)
+            self.evict()
+        return path
+
+    def entries(self):
+        """All stored segments, least recently used first."""
+        if not self.objects.exists():
+            return []
+        entries = []
+        for path in self.objects.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """Delete least recently used segments until the cache fits its budget."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            self.record("evict", str(removed))
+        return removed
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def stats(self):
+        """Summarise the store and the lookups logged since the last reset."""
+        counts = {"hit": 0, "miss": 0, "store": 0, "evict": 0}
+        if self.log_path.exists():
+            with self.log_path.open(encoding="utf-8") as log:
+                for line in log:
+                    fields = line.split()
+                    if len(fields) < 3 or fields[1] not in counts:
+                        continue
+                    counts[fields[1]] += int(fields[2]) if fields[1] == "evict" else 1
+
+        entries = self.entries()
+        lookups = counts["hit"] + counts["miss"]
+        return {
+            "root": str(self.root),
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "hits": counts["hit"],
+            "misses": counts["miss"],
+            "stored": counts["store"],
+            "evicted": counts["evict"],
+            "hit_rate": counts["hit"] / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.log_path.unlink(missing_ok=True)
+
+    def record(self, event, detail):
+        # One short append per event is atomic enough for concurrent renders
+        self.root.mkdir(parents=True, exist_ok=True)
+        with self.log_path.open("a", encoding="utf-8") as log:
+            log.write(f"{time.time():.3f} {event} {detail}\n")
+
+
+def _atomic_copy(source, target):
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def render_fingerprint():
+    """The parts of manim's config that change the pixels without changing the play hash."""
+    from manim import __version__, config
+
+    return {
+        "manim": __version__,
+        "pixel_width": config.pixel_width,
+        "pixel_height": config.pixel_height,
+        "frame_rate": config.frame_rate,
+        "movie_file_extension": config.movie_file_extension,
+        "transparent": config.transparent,
+    }
+
+
+# Digests of project source files by path and modification time
+_file_digests = {}
+
+# Module file name to its path relative to the project root, or None outside it
+_module_paths = {}
+
+
+def code_fingerprint(root=PROJECT_ROOT):
+    """
+    Digest the source of every module under ``root`` loaded in this process.
+
+    That is the scene module, its sibling modules and the ``manimations``
+    modules it uses, but not the render tooling or installed packages.
+    """
+    root = Path(root).resolve()
+    digest = hashlib.sha256()
+    for relative in sorted(_local_modules(root)):
+        path = root / relative
+        stat = path.stat()
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        if key not in _file_digests:
+            _file_digests[key] = hashlib.sha256(path.read_bytes()).hexdigest()
+        digest.update(f"{relative} {_file_digests[key]}\n".encode())
+    return digest.hexdigest()
+
+
+def _local_modules(root):
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if not filename or name in TOOLING_MODULES:
+            continue
+        if (root, filename) not in _module_paths:
+            _module_paths[root, filename] = _relative_source(root, Path(filename).resolve())
+        if _module_paths[root, filename] is not None:
+            yield _module_paths[root, filename]
+
+
+def _relative_source(root, path):
+    if not path.is_relative_to(root) or not path.is_file():
+        return None
+    # Skip virtual environments and other hidden directories in the tree
+    parts = path.relative_to(root).parts
+    if any(part.startswith(".") or part == "site-packages" for part in parts):
+        return None
+    return "/".join(parts)
+
+
+def segment_key(play_hash, fingerprint, source, code=""):
+    """Combine manim's play hash, the render config, the call's source and the module sources into one key."""
+    payload = json.dumps([play_hash, fingerprint, source, code], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:40]
+
+
+def install(cache):
+    """Route manim's partial movie caching through ``cache`` in this process."""
+    from manim import config
+    from manim.renderer import cairo_renderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    from manim.utils.file_ops import write_to_movie
+
+    manim_hash = cairo_renderer.get_hash_from_play_call
+    original_is_cached = SceneFileWriter.is_already_cached
+    original_close = SceneFileWriter.close_partial_movie_stream
+
+    # The config is read when the hooks run, not when they are installed:
+    # install runs before manim parses -q, --fps, -t, --format and the like
+    def get_hash_from_play_call(scene, camera, animations, mobjects):
+        source = statement_source(*call_site(scene))
+        play_hash = manim_hash(scene, camera, animations, mobjects)
+        return segment_key(play_hash, render_fingerprint(), source, code_fingerprint())
+
+    def is_already_cached(self, hash_invocation):
+        # Nothing is cached when no movie is written, as in manim itself
+        if not hasattr(self, "partial_movie_directory") or not write_to_movie():
+            return original_is_cached(self, hash_invocation)
+        local = self.partial_movie_directory / f"{hash_invocation}{config.movie_file_extension}"
+        if original_is_cached(self, hash_invocation):
+            # Already in this media directory; keep the shared copy fresh as well
+            cache.put(hash_invocation, local)
+            cache.record("hit", hash_invocation)
+            return True
+        return cache.fetch(hash_invocation, local)
+
+    def close_partial_movie_stream(self):
+        original_close(self)
+        path = Path(self.partial_movie_file_path)
+        # With --disable_caching segments are named by play number, not content
+        if not path.stem.startswith("uncached_"):
+            cache.put(path.stem, path)
+
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+    SceneFileWriter.is_already_cached = is_already_cached
+    SceneFileWriter.close_partial_movie_stream = close_partial_movie_stream
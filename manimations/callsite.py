@@ -0,0 +1,45 @@
+"""
+Locate the scene source line behind a ``play``/``wait`` call.
+
+Manim's hooks run deep inside its renderer; these helpers walk back up the
+stack to the statement in the scene module that triggered them.
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+
+# Parsed scene modules, reused for every source lookup in a render process
+_source_trees = {}
+
+
+def statement_source(filename, lineno):
+    """Return the source of the innermost statement of ``filename`` covering ``lineno``."""
+    if filename not in _source_trees:
+        try:
+            source = Path(filename).read_text(encoding="utf-8")
+            _source_trees[filename] = (source, ast.parse(source))
+        except (OSError, SyntaxError):
+            _source_trees[filename] = None
+    if _source_trees[filename] is None:
+        return ""
+
+    source, tree = _source_trees[filename]
+    best = None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.stmt) and node.lineno <= lineno <= node.end_lineno:
+            if best is None or node.end_lineno - node.lineno <= best.end_lineno - best.lineno:
+                best = node
+    return ast.get_source_segment(source, best) if best is not None else ""
+
+
+def call_site(scene):
+    """Return the (file, line) of the statement in ``scene``'s module that issued the current play."""
+    filename = sys.modules[type(scene).__module__].__file__
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == filename:
+            return filename, frame.f_lineno
+        frame = frame.f_back
+    return filename, 0
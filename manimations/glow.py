@@ -0,0 +1,137 @@
+"""
+Paths drawn with a soft glow around them.
+
+A glow used to be the path again, a few times over, with wider and fainter
+strokes: one mobject per layer, each with its own copy of the points, its
+own style and its own draw call, all of which had to be created, moved and
+pulsed together. ``GlowStroke`` is a single VMobject that carries its glow
+as a ``halo``, a list of extra stroke widths and opacities. ``GlowCamera``
+builds its path once and strokes it for every halo layer, outermost first,
+before the stroke itself, so it looks as the stacked copies did but is
+drawn, animated (e.g. with one ``Create``) and moved as one object.
+
+Halo opacities are relative to the path's own stroke opacity, so the glow
+fades in and out with the path. A layer can have a color of its own, and a
+``scale`` to draw it on the path scaled about its center, like a ring just
+outside a circle. A ``whole`` layer is drawn on all of the path while e.g.
+``Create`` shows only part of it, so a path can be drawn in stages: first a
+halo layer, then the rest over it.
+
+Halos are drawn by ``GlowCamera`` only: scenes using ``GlowStroke`` pass it
+as their ``camera_class``.
+"""
+
+from dataclasses import dataclass
+
+from manim import Camera, ManimColor, VMobject
+
+
+@dataclass
+class Halo:
+    # Stroke width, and opacity relative to the path's stroke opacity
+    width: float
+    opacity: float
+    # Defaults to the path's own stroke color(s)
+    color: object = None
+    # Drawn on the path scaled by this much about its center
+    scale: float = 1.0
+    # Drawn on the whole path while only part of it is shown
+    whole: bool = False
+
+    def rgbas(self, stroke_rgbas):
+        rgbas = stroke_rgbas.copy()
+        if self.color is not None:
+            rgbas[:, :3] = ManimColor(self.color).to_rgb()
+        rgbas[:, 3] *= self.opacity
+        return rgbas
+
+
+# Halo of a curve: two wider, fainter strokes, outermost first
+DEFAULT_HALO = (Halo(20, 0.2), Halo(12, 0.4))
+
+
+class GlowStroke(VMobject):
+    """A path with a halo of wider, fainter strokes, drawn by ``GlowCamera`` along with the path."""
+
+    def __init__(self, halo=DEFAULT_HALO, **kwargs):
+        self.halo = [layer if isinstance(layer, Halo) else Halo(*layer) for layer in halo]
+        # The center and points of the whole path while only part of it is shown
+        self.partial_center = None
+        self.whole_points = None
+        super().__init__(**kwargs)
+
+    @classmethod
+    def of(cls, path, halo=DEFAULT_HALO, **kwargs):
+        """Return the points and style of ``path``, e.g. a ``Circle``, with ``halo`` around them."""
+        glow = cls(halo, **kwargs)
+        glow.points = path.points.copy()
+        return glow.match_style(path)
+
+    @classmethod
+    def plot(cls, axes, function, x_range, colors, stroke_width=4, halo=DEFAULT_HALO):
+        """
+        Plot ``function`` on ``axes`` over ``x_range`` as a glowing curve.
+
+        ``function`` is called once, with an array of every x value, so it
+        must work on NumPy arrays. A third entry in ``x_range`` sets the
+        sampling step, e.g. to sample more densely for larger output.
+        """
+        glow = cls.of(axes.plot(function, x_range=x_range, use_vectorized=True), halo)
+        return glow.set_stroke(width=stroke_width).set_color_by_gradient(*colors)
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        # Keeps scaled and whole halo layers around the whole path while e.g. ``Create`` draws it
+        partial = a > 0 or b < 1
+        self.partial_center = vmobject.get_center() if partial else None
+        self.whole_points = vmobject.points if partial else None
+        return super().pointwise_become_partial(vmobject, a, b)
+
+    def get_halo_center(self):
+        return self.get_center() if self.partial_center is None else self.partial_center
+
+
+class GlowCamera(Camera):
+    """A Cairo camera that also draws the halos of ``GlowStroke``s."""
+
+    def display_vectorized(self, vmobject, ctx):
+        halo = getattr(vmobject, "halo", None)
+        if not halo or len(vmobject.points) == 0:
+            return super().display_vectorized(vmobject, ctx)
+
+        # One path for every layer, rebuilt only where a layer is scaled or whole
+        rgbas = self.get_stroke_rgbas(vmobject)
+        points = vmobject.points
+        path = (1.0, False)
+        self.set_cairo_context_path(ctx, vmobject)
+        for layer in halo:
+            whole = layer.whole and vmobject.whole_points is not None
+            # A whole layer is drawn, gradient and all, as if the whole path were shown
+            vmobject.points = vmobject.whole_points if whole else points
+            if (layer.scale, whole) != path:
+                path = (layer.scale, whole)
+                self.set_scaled_path(ctx, vmobject, layer.scale)
+            self.set_cairo_context_color(ctx, layer.rgbas(rgbas), vmobject)
+            ctx.set_line_width(layer.width * self.cairo_line_width_multiple)
+            ctx.stroke_preserve()
+        vmobject.points = points
+        if path != (1.0, False):
+            self.set_cairo_context_path(ctx, vmobject)
+
+        self.apply_stroke(ctx, vmobject, background=True)
+        self.apply_fill(ctx, vmobject)
+        self.apply_stroke(ctx, vmobject)
+        return self
+
+    def set_scaled_path(self, ctx, vmobject, scale):
+        """Set the path of ``vmobject`` scaled by ``scale`` about its halo center, like ``set_cairo_context_path``."""
+        center = vmobject.get_halo_center()
+        points = self.transform_points_pre_display(vmobject, center + (vmobject.points - center) * scale)
+        ctx.new_path()
+        for subpath in vmobject.gen_subpaths_from_points_2d(points):
+            ctx.new_sub_path()
+            ctx.move_to(*subpath[0][:2])
+            for _, p1, p2, p3 in vmobject.gen_cubic_bezier_tuples_from_points(subpath):
+                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+                ctx.close_path()
+        return self
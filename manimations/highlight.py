@@ -0,0 +1,122 @@
+"""
+Pooled glow highlights.
+
+Highlighting by copying a group, restyling the copy and fading it in costs
+a deep copy of every submobject on every highlight, and the standard fade
+animations copy it twice more. A ``GlowPool`` instead keeps a few ``Glow``
+overlays around. Retargeting an overlay copies the points of the source's
+submobjects into the overlay's slots, each of which keeps a buffer that
+only ever grows, and ``GlowFade`` animates the overlay's opacity in place.
+Once the pool has warmed up, a highlight allocates no new submobjects or
+point arrays, however large the highlighted group is.
+
+The source is animated with transforms that replace its point arrays, so
+an overlay copies the points again whenever a ``GlowFade`` of it begins,
+and always outlines the source as it is at the start of the fade.
+"""
+
+import numpy as np
+from manim import Animation, VGroup, VMobject, smooth
+
+from manimations._anim import NoStartingCopy
+
+DEFAULT_STROKE_WIDTH = 4
+
+
+class Glow(VGroup):
+    """A highlight overlay whose slots hold copies of the points of a source."""
+
+    def __init__(self, pool=None, **kwargs):
+        super().__init__(**kwargs)
+        self.pool = pool
+        self.glow_opacity = 0.0
+        self.sources = ()
+        # One point buffer per slot, reused from highlight to highlight
+        self.buffers = []
+
+    def retarget(self, sources, color, stroke_width=DEFAULT_STROKE_WIDTH):
+        self.sources = sources
+        self.refresh()
+        self.set_fill(color)
+        self.set_stroke(color, width=stroke_width)
+        return self.set_glow_opacity(0)
+
+    def refresh(self):
+        """Copy the current points of the sources' submobjects into the slots."""
+        leaves = [leaf for source in self.sources for leaf in source.family_members_with_points()]
+        if len(leaves) > len(self.submobjects):
+            added = len(leaves) - len(self.submobjects)
+            self.add(*[VMobject() for _ in range(added)])
+            self.buffers.extend(np.zeros((0, 3)) for _ in range(added))
+        for index, slot in enumerate(self.submobjects):
+            points = leaves[index].points if index < len(leaves) else self.buffers[index][:0]
+            if len(points) > len(self.buffers[index]):
+                self.buffers[index] = np.empty((max(len(points), 2 * len(self.buffers[index])), 3))
+            slot.points = self.buffers[index][:len(points)]
+            slot.points[:] = points
+        return self
+
+    def set_glow_opacity(self, opacity):
+        self.glow_opacity = opacity
+        self.set_fill(opacity=opacity)
+        self.set_stroke(opacity=opacity)
+        return self
+
+    def release(self):
+        # Forget the source and go back to the pool
+        self.sources = ()
+        self.refresh()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class GlowPool:
+    """Reusable ``Glow`` overlays, handed out by ``acquire``."""
+
+    def __init__(self, stroke_width=DEFAULT_STROKE_WIDTH):
+        self.stroke_width = stroke_width
+        self.free = []
+        self.created = 0
+
+    def acquire(self, *sources, color):
+        """Return an invisible overlay outlining ``sources`` in ``color``."""
+        if self.free:
+            glow = self.free.pop()
+        else:
+            glow = Glow(pool=self)
+            self.created += 1
+        return glow.retarget(sources, color, self.stroke_width)
+
+    def release(self, glow):
+        if glow not in self.free:
+            self.free.append(glow)
+
+
+class GlowFade(NoStartingCopy, Animation):
+    """
+    Fade a ``Glow`` from ``start`` to ``end`` opacity without copying it.
+
+    ``rate_func`` maps time to the fraction of the way from ``start`` to
+    ``end``, so a pulse is ``start=0, end=1`` with a rate function that comes
+    back to 0. With ``remover=True`` the overlay leaves the scene and returns
+    to its pool at the end.
+    """
+
+    def __init__(self, glow, start=None, end=1.0, rate_func=smooth, **kwargs):
+        self.start = glow.glow_opacity if start is None else start
+        self.end = end
+        super().__init__(glow, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        # The source may have been transformed since the overlay was placed
+        self.mobject.refresh()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.set_glow_opacity(self.start + (self.end - self.start) * t)
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self.is_remover():
+            self.mobject.release()
@@ -0,0 +1,44 @@
+"""
+Run manim's command line with the manimations hooks installed.
+
+The render driver starts every manim process through this module instead of
+``python -m manim``. It takes exactly the same arguments; the hooks to
+install are chosen through environment variables so the driver can switch
+them per job: ``MANIMATIONS_NO_CACHE`` turns off the segment cache and
+``MANIMATIONS_TRACE`` turns on trace profiling.
+
+    python -m manimations.launch render -ql holarchy/main.py DocumentationHolarchy
+"""
+
+import os
+import sys
+
+from manimations.trace import TRACE_ENV
+
+# Set to a non-empty value to render without the shared segment cache
+NO_CACHE_ENV = "MANIMATIONS_NO_CACHE"
+
+
+def install_hooks():
+    if not os.environ.get(NO_CACHE_ENV):
+        from manimations.cache import RenderCache, install
+
+        install(RenderCache.from_env())
+
+    # Installed last so its spans include the cache hooks
+    if os.environ.get(TRACE_ENV):
+        from manimations.trace import Tracer, install
+
+        install(Tracer(), os.environ[TRACE_ENV])
+
+
+def main():
+    install_hooks()
+
+    from manim.__main__ import main as manim_main
+
+    manim_main(prog_name="manim")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
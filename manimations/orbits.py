@@ -0,0 +1,66 @@
+"""
+Particles going round circular orbits, e.g. the electrons of atoms.
+
+Spinning each electron with its own ``Rotating`` (or a ``dt`` updater)
+rotates its points a little further every frame, one rotation matrix per
+electron, and every play starts from wherever the last one left it, so the
+rounding errors add up. ``Orbits`` keeps the center, radius, angular speed
+and starting angle of every orbit in NumPy arrays, along with a clock, and
+places every particle from the time on the clock in closed form. Running
+the clock forward, with ``RunOrbits``, moves any number of electrons of any
+number of atoms in one array operation per frame, and the same time always
+gives the same positions.
+
+The particles are drawn as a ``ParticleCloud``, see particles.py.
+"""
+
+import numpy as np
+from manim import Animation, linear
+
+from manimations._anim import NoStartingCopy
+from manimations.particles import ParticleCloud
+
+
+class Orbits(ParticleCloud):
+    """
+    Particles going round ``centers`` at ``radii``, at ``speeds`` radians per second from ``phases``.
+
+    Every argument is either one value per orbit or a single value for all
+    of them; ``particle_radii`` and the remaining keyword arguments are
+    those of ``ParticleCloud``.
+    """
+
+    def __init__(self, centers, radii, speeds, phases=0.0, time=0.0, particle_radii=0.06, **kwargs):
+        centers = np.array(centers, dtype=float).reshape(-1, 3)
+        count = max(len(centers), *(np.size(values) for values in (radii, speeds, phases)))
+        self.centers = np.broadcast_to(centers, (count, 3)).copy()
+        self.orbit_radii, self.speeds, self.phases = (
+            np.broadcast_to(np.asarray(values, dtype=float), (count,)).copy() for values in (radii, speeds, phases)
+        )
+        self.time = time
+        super().__init__(self.positions_at(time), radii=particle_radii, **kwargs)
+
+    def positions_at(self, time):
+        """Return where the particles are ``time`` seconds on the orbits' clock."""
+        angles = self.phases + self.speeds * time
+        offsets = np.column_stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)])
+        return self.centers + self.orbit_radii[:, None] * offsets
+
+    def set_time(self, time):
+        """Set the orbits' clock and move the particles to where they are then."""
+        self.time = time
+        return self.set_particles(positions=self.positions_at(time))
+
+
+class RunOrbits(NoStartingCopy, Animation):
+    """Run the clock of ``orbits`` forward by the run time of the animation."""
+
+    def __init__(self, orbits, rate_func=linear, **kwargs):
+        super().__init__(orbits, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.start_time = self.mobject.time
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_time(self.start_time + self.rate_func(alpha) * self.run_time)
@@ -0,0 +1,143 @@
+"""
+Clouds of many small particles, drawn and animated as arrays.
+
+A particle as a ``Dot`` is a mobject with its own points, style and draw
+call, and animating n of them takes n animations, each with a starting copy
+of its dot, and n calls to pick their random offsets. ``ParticleCloud``
+keeps the positions, radii and opacities of all its particles in NumPy
+arrays and builds the points of every particle from a circle template in
+one vectorized step. Opacities are rounded to ``OPACITY_LEVELS`` levels and
+the particles at each level are one VMobject, so however many particles
+there are, the cloud is a handful of mobjects and fills. (Particles filled
+together do not add up where they overlap, as separate dots would.)
+
+Drawing a level's path the usual way still walks its points one by one in
+Python, so ``ParticleCamera`` draws the levels from the particle arrays
+instead, as one Cairo arc per particle. The points are still built, for the
+bounding box and for other cameras.
+
+Particles are moved through their arrays, e.g. by ``AnimateParticles``,
+rather than with the usual mobject methods.
+
+``AnimateParticles`` moves and fades the particles from their current
+arrays to new ones, optionally one after the other, also as array
+operations: thousands of particles cost about as much as a dozen.
+"""
+
+import numpy as np
+from manim import TAU, WHITE, Animation, Camera, Circle, Dot, VGroup, VMobject
+
+from manimations._anim import RATE_SAMPLES, NoStartingCopy, rate_table
+
+# Particles are small, so four arcs make a round enough circle
+_CIRCLE = Circle(radius=1, num_components=5).points
+
+# How many opacities particles are drawn with, between 0 and 1
+OPACITY_LEVELS = 32
+
+def _as_array(values, count):
+    return np.broadcast_to(np.asarray(values, dtype=float), (count,)).copy()
+
+
+class ParticleCloud(VGroup):
+    """Particles at ``positions``, each a dot of its own radius and opacity in one color."""
+
+    def __init__(self, positions, radii=0.06, opacities=1.0, color=WHITE, **kwargs):
+        super().__init__(**kwargs)
+        self.particle_color = color
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        self.radii = _as_array(radii, len(self.positions))
+        self.opacities = _as_array(opacities, len(self.positions))
+        # One VMobject per opacity level; hidden particles are not drawn at all
+        self.add(*[
+            VMobject(fill_color=color, fill_opacity=level / OPACITY_LEVELS, stroke_width=0)
+            for level in range(1, OPACITY_LEVELS + 1)
+        ])
+        self.update_particles()
+
+    def set_particles(self, positions=None, radii=None, opacities=None):
+        """Replace any of the particle arrays and redraw the particles."""
+        if positions is not None:
+            self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        if radii is not None:
+            self.radii = _as_array(radii, len(self.positions))
+        if opacities is not None:
+            self.opacities = _as_array(opacities, len(self.positions))
+        return self.update_particles()
+
+    def update_particles(self):
+        """Rebuild the points of every opacity level from the particle arrays."""
+        levels = np.rint(np.clip(self.opacities, 0, 1) * OPACITY_LEVELS).astype(int)
+        order = np.argsort(levels, kind="stable")
+        bounds = np.searchsorted(levels[order], np.arange(1, OPACITY_LEVELS + 2))
+        points = _CIRCLE * self.radii[order, None, None] + self.positions[order, None, :]
+        # Centers and radii, as ``ParticleCamera`` draws them
+        circles = np.column_stack([self.positions[order, :2], self.radii[order]])
+        for level, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            self.submobjects[level].points = points[start:end].reshape(-1, 3)
+            self.submobjects[level].particles = circles[start:end]
+        return self
+
+    def particle(self, index):
+        """Return a ``Dot`` that looks like the particle at ``index``, e.g. to animate it on its own."""
+        return Dot(
+            self.positions[index], radius=self.radii[index], color=self.particle_color, fill_opacity=self.opacities[index],
+        )
+
+
+class AnimateParticles(NoStartingCopy, Animation):
+    """
+    Move the particles of ``cloud`` to ``positions`` and fade them to ``opacities``.
+
+    Either target can be a single value for every particle. With a
+    ``spread`` between 0 and 1, the particles start one after the other,
+    evenly over that fraction of the run time: however many there are,
+    each one takes the remaining 1 - ``spread`` of it and follows
+    ``rate_func`` on its own.
+    """
+
+    def __init__(self, cloud, positions=None, opacities=None, spread=0.0, **kwargs):
+        self.target_positions = positions
+        self.target_opacities = opacities
+        self.spread = spread
+        super().__init__(cloud, **kwargs)
+
+    def begin(self):
+        cloud = self.mobject
+        self.start_positions = cloud.positions.copy()
+        self.start_opacities = cloud.opacities.copy()
+        self.end_positions = self.start_positions.copy()
+        if self.target_positions is not None:
+            self.end_positions[:] = self.target_positions
+        self.end_opacities = self.start_opacities.copy()
+        if self.target_opacities is not None:
+            self.end_opacities[:] = self.target_opacities
+        self.rates = rate_table(self.rate_func)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        count = len(self.start_positions)
+        if self.spread and count > 1:
+            starts = np.linspace(0, self.spread, count)
+            local = np.clip((alpha - starts) / (1 - self.spread), 0, 1)
+        else:
+            local = np.full(count, alpha)
+        fractions = np.interp(local, RATE_SAMPLES, self.rates)
+        self.mobject.set_particles(
+            positions=self.start_positions + (self.end_positions - self.start_positions) * fractions[:, None],
+            opacities=self.start_opacities + (self.end_opacities - self.start_opacities) * fractions,
+        )
+
+
+class ParticleCamera(Camera):
+    """A Cairo camera that draws the particles of ``ParticleCloud``s as one arc each."""
+
+    def set_cairo_context_path(self, ctx, vmobject):
+        particles = getattr(vmobject, "particles", None)
+        if particles is None:
+            return super().set_cairo_context_path(ctx, vmobject)
+        ctx.new_path()
+        for x, y, radius in particles.tolist():
+            ctx.new_sub_path()
+            ctx.arc(x, y, radius, 0, TAU)
+        return self
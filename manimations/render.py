@@ -0,0 +1,310 @@
+"""
+Scene discovery and parallel rendering.
+
+Every project directory holds a ``main.py`` with one or more ``Scene``
+subclasses. The scenes are found by parsing the files rather than importing
+them, so the driver itself never has to load manim. Each scene is then
+rendered by its own ``manim`` process, with a pool bounding how many of them
+run at once.
+
+Scenes that declare ``SECTIONS`` (see ``manimations.sections``) can also be
+split so that every section renders in its own process. The section videos
+are then joined back together without re-encoding.
+"""
+
+import ast
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+# Repository root, one level above this package
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Environment variable naming the single section a manim process should render
+SECTION_ENV = "MANIMATIONS_SECTION"
+
+# Base classes that mark a class as a renderable scene
+SCENE_BASES = {
+    "Scene",
+    "SectionedScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "ThreeDScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+# Directories that never contain project scenes
+IGNORED_DIRS = {"manimations", "media", "__pycache__"}
+
+
+@dataclass(frozen=True)
+class SceneSpec:
+    """A scene class and the file that defines it, optionally narrowed to one section."""
+
+    path: Path
+    name: str
+    section: str | None = None
+
+    @property
+    def project(self):
+        return self.path.parent.name
+
+    @property
+    def output_name(self):
+        return f"{self.name}_{self.section}" if self.section else self.name
+
+    @property
+    def media_dir(self):
+        # Sections get their own media directory so that concurrent manim
+        # processes never share a partial movie folder
+        if self.section:
+            return PROJECT_ROOT / "media" / "sections" / self.name / self.section
+        return PROJECT_ROOT / "media"
+
+    def __str__(self):
+        label = f"{self.project}:{self.name}"
+        return f"{label}[{self.section}]" if self.section else label
+
+
+@dataclass
+class RenderResult:
+    """Outcome of rendering one scene."""
+
+    scene: SceneSpec
+    returncode: int
+    wall_time: float
+    output: str = ""
+    # Peak resident set size of the manim process in bytes, where the OS reports it
+    peak_rss: int | None = None
+
+    @property
+    def ok(self):
+        return self.returncode == 0
+
+
+def _base_name(node):
+    # Handles both ``Scene`` and ``manim.Scene`` style bases
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def find_scene_classes(path):
+    """Return the names of the scene classes defined in ``path``, in source order."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+
+    # Repeat until stable so that subclasses of local scenes are picked up too
+    scene_names = set(SCENE_BASES)
+    found = []
+    changed = True
+    while changed:
+        changed = False
+        for node in classes:
+            if node.name in found:
+                continue
+            if any(_base_name(base) in scene_names for base in node.bases):
+                found.append(node.name)
+                scene_names.add(node.name)
+                changed = True
+
+    order = {node.name: i for i, node in enumerate(classes)}
+    return sorted(found, key=order.__getitem__)
+
+
+def find_sections(path, name):
+    """Return the ``SECTIONS`` declared in the body of class ``name``, if any."""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == name):
+            continue
+        for stmt in node.body:
+            if (
+                isinstance(stmt, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "SECTIONS" for t in stmt.targets)
+            ):
+                return tuple(ast.literal_eval(stmt.value))
+    return ()
+
+
+def split_sections(specs):
+    """Replace every scene that declares sections with one spec per section."""
+    split = []
+    for spec in specs:
+        sections = find_sections(spec.path, spec.name)
+        if sections:
+            split.extend(SceneSpec(spec.path, spec.name, section) for section in sections)
+        else:
+            split.append(spec)
+    return split
+
+
+def discover_scenes(root=PROJECT_ROOT):
+    """Find every scene under the project directories of ``root``."""
+    specs = []
+    for path in sorted(Path(root).glob("*/main.py")):
+        project = path.parent.name
+        if project in IGNORED_DIRS or project.startswith("."):
+            continue
+        for name in find_scene_classes(path):
+            specs.append(SceneSpec(path, name))
+    return specs
+
+
+def select_scenes(specs, patterns):
+    """Keep the scenes matching any of ``patterns`` (class or project name)."""
+    if not patterns:
+        return list(specs)
+    wanted = set(patterns)
+    return [spec for spec in specs if spec.name in wanted or spec.project in wanted]
+
+
+def manim_command(spec, quality="l", extra_args=()):
+    """Build the command line that renders ``spec`` in a fresh interpreter."""
+    # manimations.launch is manim's own CLI with the cache hooks installed
+    command = [sys.executable, "-m", "manimations.launch", "render", f"-q{quality}", *extra_args]
+    if spec.section:
+        command += ["--media_dir", str(spec.media_dir), "-o", spec.output_name]
+    return command + [str(spec.path), spec.name]
+
+
+def render_scene(spec, quality="l", extra_args=(), env=None):
+    """Render a single scene in its own manim process and time it."""
+    command = manim_command(spec, quality, extra_args)
+    env = {**os.environ, **(env or {})}
+    if spec.section:
+        env[SECTION_ENV] = spec.section
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        command,
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    output = proc.stdout.read()
+    proc.stdout.close()
+
+    peak_rss = None
+    if hasattr(os, "wait4"):
+        # Reap the child ourselves to get its own resource usage
+        _, status, usage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+        peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+    else:
+        proc.wait()
+    return RenderResult(spec, proc.returncode, time.perf_counter() - start, output, peak_rss)
+
+
+def render_all(specs, jobs=None, quality="l", extra_args=(), on_result=None):
+    """
+    Render ``specs`` with at most ``jobs`` manim processes running at once.
+
+    Every render is already a separate process, so the pool only has to
+    schedule them; threads are enough for that. Results come back in the
+    order of ``specs``, and ``on_result`` is called as each one finishes.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(render_scene, spec, quality, extra_args): spec
+            for spec in specs
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    return [results[spec] for spec in specs]
+
+
+def format_report(results):
+    """Summarise a batch of renders as a plain-text table."""
+    width = max([len(str(r.scene)) for r in results] + [len("scene")])
+    lines = [f"{'scene':<{width}}  {'exit':>4}  {'seconds':>8}"]
+    for result in results:
+        lines.append(f"{str(result.scene):<{width}}  {result.returncode:>4}  {result.wall_time:>8.2f}")
+    total = sum(r.wall_time for r in results)
+    failed = sum(not r.ok for r in results)
+    lines.append(f"{len(results)} scene(s), {failed} failed, {total:.2f}s of render time")
+    return "\n".join(lines)
+
+
+def find_output(spec):
+    """Locate the most recent video manim wrote for ``spec``."""
+    candidates = [
+        path for path in (spec.media_dir / "videos").rglob(f"{spec.output_name}.*")
+        if "partial_movie_files" not in path.parts
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: path.stat().st_mtime)
+
+
+def concat_videos(inputs, output):
+    """
+    Join videos with identical encoding settings into ``output``.
+
+    Packets are copied across as they are, the same way manim combines its
+    partial movie files, so nothing is decoded or re-encoded.
+    """
+    import av
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    file_list = output.with_suffix(".txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for path in inputs:
+            fp.write(f"file 'file:{Path(path).resolve().as_posix()}'\n")
+
+    with av.open(str(file_list), options={"safe": "0", "an": "1"}, format="concat") as source:
+        source_stream = source.streams.video[0]
+        with av.open(str(output), mode="w") as target:
+            target_stream = target.add_stream(template=source_stream)
+            for packet in source.demux(source_stream):
+                # Skip the flushing packets that demux generates
+                if packet.dts is None:
+                    continue
+                # Let libav recompute dts, since it restarts in every input
+                packet.dts = None
+                packet.stream = target_stream
+                target.mux(packet)
+
+    file_list.unlink()
+    return output
+
+
+def join_sections(results):
+    """
+    Concatenate the section videos of every fully rendered sectioned scene.
+
+    Returns a mapping of scene to the joined video. The video is placed
+    where manim would have written an unsplit render of the scene.
+    """
+    grouped = {}
+    for result in results:
+        if result.scene.section:
+            grouped.setdefault((result.scene.path, result.scene.name), []).append(result)
+
+    joined = {}
+    for (path, name), parts in grouped.items():
+        if not all(part.ok for part in parts):
+            continue
+        outputs = [find_output(part.scene) for part in parts]
+        if None in outputs:
+            continue
+        first = parts[0].scene
+        relative = outputs[0].parent.relative_to(first.media_dir)
+        target = PROJECT_ROOT / "media" / relative / f"{name}{outputs[0].suffix}"
+        joined[SceneSpec(path, name)] = concat_videos(outputs, target)
+    return joined
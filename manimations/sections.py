@@ -0,0 +1,50 @@
+"""
+Scenes split into independently renderable sections.
+
+A ``SectionedScene`` lists its sections in ``SECTIONS`` and implements one
+``section_<name>`` method per entry. Rendered normally it plays them all in
+order. When ``MANIMATIONS_SECTION`` names one of them, every earlier section
+runs with manim's ``skip_animations`` so that its mobjects end up in their
+final state without a single frame being drawn, the named section is
+rendered, and the scene stops there. That lets the render driver give each
+section its own process and concatenate the results afterwards.
+
+For the cut between sections to be seamless, a section's starting state must
+not depend on how the previous one was rendered: the random seed is fixed,
+and anything that moves should be driven by animations (whose final state is
+exact) rather than by ``dt`` updaters.
+"""
+
+import os
+import random
+
+import numpy as np
+from manim import Scene
+
+from manimations.render import SECTION_ENV
+
+
+class SectionedScene(Scene):
+    # Section names, in playback order
+    SECTIONS = ()
+
+    # Seed applied before the first section so that replays are identical
+    SEED = 0
+
+    def setup_sections(self):
+        """Build whatever every section needs before the first one starts."""
+
+    def construct(self):
+        target = os.environ.get(SECTION_ENV)
+        if target and target not in self.SECTIONS:
+            raise ValueError(f"{type(self).__name__} has no section {target!r}; expected one of {self.SECTIONS}")
+
+        random.seed(self.SEED)
+        np.random.seed(self.SEED)
+
+        self.setup_sections()
+        for name in self.SECTIONS:
+            self.next_section(name, skip_animations=bool(target) and name != target)
+            getattr(self, f"section_{name}")()
+            if name == target:
+                break
@@ -0,0 +1,135 @@
+"""
+Many straight segments drawn as one mobject.
+
+An org chart over n children is n + 3 ``Line``s, each a VMobject with its
+own style, family and draw call, and animating it takes an animation and a
+starting copy per line. ``Segments`` keeps the segments as the subpaths of
+a single VMobject instead: one point array and one stroke however many
+there are, at the price of sharing one style.
+
+``GrowSegments`` draws segments from their start points, or extends them to
+new end points, rebuilding the point array in one vectorized step per
+frame. Segments can be given stages, which run one after the other within
+the animation, so e.g. the risers, the halves of the bar meeting in the
+middle and the stem of an org chart come in bottom to top in a single play.
+Given a ``lag_ratio``, the segments of a stage come in one after the other
+by index instead, like a ``LaggedStart`` of ``Create``s, e.g. to draw the
+thousands of edges of a graph built with ``Segments.along``.
+
+Building the Cairo path of a VMobject walks its points one by one in
+Python, so ``SegmentsCamera`` draws ``Segments`` from their end points
+instead, as one line each.
+"""
+
+import numpy as np
+from manim import Animation, Camera, VMobject, smooth
+
+from manimations._anim import RATE_SAMPLES, NoStartingCopy, rate_table
+
+# Where the control points of a straight cubic bezier sit along it
+_THIRDS = np.linspace(0, 1, 4)[:, None]
+
+
+def _segment_points(starts, ends):
+    return (starts[:, None] + (ends - starts)[:, None] * _THIRDS).reshape(-1, 3)
+
+
+class Segments(VMobject):
+    """Straight segments from ``starts[i]`` to ``ends[i]``, drawn as one mobject."""
+
+    def __init__(self, starts=(), ends=(), **kwargs):
+        super().__init__(**kwargs)
+        self.set_segments(starts, ends)
+
+    def set_segments(self, starts, ends):
+        """Replace the segments, e.g. to reuse the mobject for other ones."""
+        starts = np.array(starts, dtype=float).reshape(-1, 3)
+        ends = np.array(ends, dtype=float).reshape(-1, 3)
+        self.points = _segment_points(starts, ends)
+        return self
+
+    @classmethod
+    def along(cls, points, pairs, **kwargs):
+        """Return the edges ``(i, j)`` in ``pairs`` of a graph, from ``points[i]`` to ``points[j]``."""
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        pairs = np.asarray(pairs).reshape(-1, 2)
+        return cls(points[pairs[:, 0]], points[pairs[:, 1]], **kwargs)
+
+    def get_segments(self):
+        """Return the start and end points of the segments, wherever the mobject has moved."""
+        return self.points[0::4].copy(), self.points[3::4].copy()
+
+    def set_segment(self, index, start, end):
+        starts, ends = self.get_segments()
+        starts[index], ends[index] = start, end
+        return self.set_segments(starts, ends)
+
+
+class GrowSegments(NoStartingCopy, Animation):
+    """
+    Draw ``segments`` from their start points, or extend them to ``ends``.
+
+    Without ``ends`` every segment grows from nothing to its full length,
+    like ``Create``. With ``ends``, the segments at ``indices`` (all of
+    them by default) move their end points there. ``stages`` gives every
+    animated segment a stage number; stages share the run time equally and
+    run in order, each with the full ``rate_func``. With a ``lag_ratio``,
+    the segments of a stage start one after the other in index order, each
+    ``lag_ratio`` of a segment's time after the last, as in a ``LaggedStart``.
+    """
+
+    def __init__(self, segments, ends=None, indices=None, stages=None, rate_func=smooth, **kwargs):
+        self.ends = None if ends is None else np.array(ends, dtype=float).reshape(-1, 3)
+        self.indices = indices
+        self.stages = stages
+        super().__init__(segments, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        self.starts, ends = self.mobject.get_segments()
+        indices = np.arange(len(self.starts)) if self.indices is None else np.asarray(self.indices)
+        if self.ends is None:
+            self.tips_from, self.tips_to = self.starts.copy(), ends.copy()
+        else:
+            self.tips_from, self.tips_to = ends.copy(), ends.copy()
+            self.tips_to[indices] = self.ends
+        stages = np.zeros(len(indices), dtype=int) if self.stages is None else np.asarray(self.stages)
+        self.segment_stages = np.full(len(self.starts), -1)
+        self.segment_stages[indices] = stages
+        self.stage_count = max(stages.max() + 1, 1) if len(stages) else 1
+        # Where every segment comes within its stage, and how many share it
+        self.segment_ranks = np.zeros(len(self.starts))
+        self.stage_sizes = np.ones(len(self.starts))
+        if self.lag_ratio:
+            for stage in range(self.stage_count):
+                members = np.sort(indices[stages == stage])
+                self.segment_ranks[members] = np.arange(len(members))
+                self.stage_sizes[members] = len(members)
+            self.rates = rate_table(self.rate_func)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        local = np.clip(alpha * self.stage_count - np.arange(self.stage_count), 0, 1)
+        if self.lag_ratio:
+            lagged = local[self.segment_stages] * ((self.stage_sizes - 1) * self.lag_ratio + 1)
+            lagged = np.clip(lagged - self.segment_ranks * self.lag_ratio, 0, 1)
+            fractions = np.interp(lagged, RATE_SAMPLES, self.rates)
+        else:
+            fractions = np.array([self.rate_func(t) for t in local])[self.segment_stages]
+        # Segments that are not animated (stage -1) stay where they are
+        fractions = np.where(self.segment_stages >= 0, fractions, 1.0)
+        tips = self.tips_from + (self.tips_to - self.tips_from) * fractions[:, None]
+        self.mobject.points = _segment_points(self.starts, tips)
+
+
+class SegmentsCamera(Camera):
+    """A Cairo camera that draws ``Segments`` as one line each."""
+
+    def set_cairo_context_path(self, ctx, vmobject):
+        if not isinstance(vmobject, Segments):
+            return super().set_cairo_context_path(ctx, vmobject)
+        ctx.new_path()
+        starts, ends = vmobject.points[0::4, :2].tolist(), vmobject.points[3::4, :2].tolist()
+        for start, end in zip(starts, ends):
+            ctx.move_to(*start)
+            ctx.line_to(*end)
+        return self
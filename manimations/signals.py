@@ -0,0 +1,97 @@
+"""
+Signals firing along the edges of a graph, e.g. the connections of a nervous system.
+
+A signal as a ``Dot`` moved with ``.animate.move_to(...)`` is a mobject and
+an animation with a starting copy per edge, and waves of them are picked by
+hand. ``Signals`` gives every edge of an edge list one pulse, drawn as a
+``ParticleCloud`` (see particles.py), and keeps how far along its edge each
+pulse is in a NumPy array, so the positions of all of them are interpolated
+at once. ``FirePulses`` sends pulses along their edges, in stages that run
+one after the other, and ``cascade`` works out the stages of a wave that
+spreads through the graph from some of its nodes.
+
+Pulses are hidden until they are faded in, e.g. with ``AnimateParticles``.
+"""
+
+import numpy as np
+from manim import YELLOW, Animation, smooth
+
+from manimations._anim import NoStartingCopy
+from manimations.particles import ParticleCloud
+
+
+def cascade(pairs, sources):
+    """
+    Return the stage at which each ``(i, j)`` edge in ``pairs`` fires in a wave from the ``sources`` nodes.
+
+    Edges leaving the sources fire at stage 0, edges leaving the nodes
+    those reach at stage 1, and so on; edges the wave never reaches get -1.
+    """
+    pairs = np.asarray(pairs).reshape(-1, 2)
+    reached = np.zeros(pairs.max() + 1 if len(pairs) else 0, dtype=bool)
+    reached[list(sources)] = True
+    stages = np.full(len(pairs), -1)
+    stage = 0
+    while True:
+        firing = reached[pairs[:, 0]] & (stages < 0)
+        if not firing.any():
+            return stages
+        stages[firing] = stage
+        reached[pairs[firing, 1]] = True
+        stage += 1
+
+
+class Signals(ParticleCloud):
+    """One pulse per edge from ``starts[i]`` to ``ends[i]``, starting out hidden at the start of its edge."""
+
+    def __init__(self, starts, ends, radii=0.08, color=YELLOW, **kwargs):
+        self.starts = np.array(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.array(ends, dtype=float).reshape(-1, 3)
+        # How far along its edge every pulse is, from 0 to 1
+        self.progress = np.zeros(len(self.starts))
+        super().__init__(self.starts, radii=radii, opacities=0, color=color, **kwargs)
+
+    @classmethod
+    def along(cls, points, pairs, **kwargs):
+        """Return the pulses of the ``(i, j)`` edges in ``pairs``, from ``points[i]`` to ``points[j]``."""
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        pairs = np.asarray(pairs).reshape(-1, 2)
+        return cls(points[pairs[:, 0]], points[pairs[:, 1]], **kwargs)
+
+    def set_progress(self, progress):
+        """Move every pulse ``progress`` of the way along its edge."""
+        self.progress = np.broadcast_to(np.asarray(progress, dtype=float), self.progress.shape).copy()
+        return self.set_particles(positions=self.starts + (self.ends - self.starts) * self.progress[:, None])
+
+
+class FirePulses(NoStartingCopy, Animation):
+    """
+    Send the pulses of ``signals`` along their edges, from start to end.
+
+    Only the pulses at ``indices`` (all of them by default) are sent.
+    ``stages`` gives each of those a stage number, e.g. from ``cascade``;
+    stages share the run time equally and run in order, each with the full
+    ``rate_func``.
+    """
+
+    def __init__(self, signals, indices=None, stages=None, rate_func=smooth, **kwargs):
+        self.indices = indices
+        self.stages = stages
+        super().__init__(signals, rate_func=rate_func, **kwargs)
+
+    def begin(self):
+        signals = self.mobject
+        indices = np.arange(len(signals.progress)) if self.indices is None else np.asarray(self.indices)
+        stages = np.zeros(len(indices), dtype=int) if self.stages is None else np.asarray(self.stages)
+        self.start_progress = signals.progress.copy()
+        self.pulse_stages = np.full(len(signals.progress), -1)
+        self.pulse_stages[indices] = stages
+        self.stage_count = max(stages.max() + 1, 1) if len(stages) else 1
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        # Pulses that are not sent (stage -1) stay where they are
+        local = np.clip(alpha * self.stage_count - np.arange(self.stage_count), 0, 1)
+        fractions = np.array([self.rate_func(t) for t in local])
+        progress = np.where(self.pulse_stages >= 0, fractions[self.pulse_stages], self.start_progress)
+        self.mobject.set_progress(progress)
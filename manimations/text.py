@@ -0,0 +1,87 @@
+"""
+Memoized ``Text`` construction.
+
+Building a ``Text`` runs a full Pango layout and parses the resulting SVG
+into bezier paths. Scenes that show the same label over and over (tree lines,
+level names) pay that cost every time. ``cached_text`` builds each distinct
+label once and hands out copies of the prebuilt glyph paths instead, which
+only costs a copy of the point arrays.
+
+The cache is keyed on the string and every keyword argument (font, size,
+color, weight, ...), is bounded in size with least recently used eviction,
+and keeps hit/miss counts that are logged when the render process exits.
+"""
+
+import atexit
+from collections import OrderedDict
+
+import numpy as np
+from manim import ManimColor, Text, logger
+
+DEFAULT_MAXSIZE = 256
+
+
+def _freeze(value):
+    # Turn keyword values into something hashable and stable
+    if isinstance(value, ManimColor):
+        return ("color", value.to_hex(with_alpha=True))
+    if isinstance(value, np.ndarray):
+        return ("array", value.shape, tuple(value.ravel().tolist()))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class TextCache:
+    """Prebuilt ``Text`` prototypes, copied out on every lookup."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, factory=Text):
+        self.maxsize = maxsize
+        self.factory = factory
+        self.prototypes = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, text, **kwargs):
+        key = (text, _freeze(kwargs))
+        prototype = self.prototypes.get(key)
+        if prototype is None:
+            self.misses += 1
+            prototype = self.factory(text, **kwargs)
+            self.prototypes[key] = prototype
+            if len(self.prototypes) > self.maxsize:
+                self.prototypes.popitem(last=False)
+        else:
+            self.hits += 1
+            self.prototypes.move_to_end(key)
+        return prototype.copy()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.prototypes),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        self.prototypes.clear()
+        self.hits = self.misses = 0
+
+
+# Shared by every scene rendered in this process
+cached_text = TextCache()
+
+
+@atexit.register
+def _log_stats():
+    stats = cached_text.stats()
+    if stats["hits"] or stats["misses"]:
+        logger.info(
+            "Text cache: %(hits)d hits, %(misses)d misses (%(rate).0f%%), %(size)d/%(maxsize)d prototypes",
+            {**stats, "rate": stats["hit_rate"] * 100},
+        )
@@ -0,0 +1,222 @@
+"""
+Many small plays compiled into one.
+
+Every ``self.play``/``self.wait`` is its own render segment: the scene is
+hashed, a partial movie file is opened, static mobjects are painted and the
+moving ones sorted out again. Scenes that step through dozens of 0.2 second
+animations spend a good share of their render time on that. Inside
+``with coalesce(scene):`` the scene's renderer is a ``Timeline``, which
+schedules each play at an explicit start offset instead of rendering it, and
+the block is played as a single ``Scheduled`` animation when it ends. The
+calls still go through ``Scene.play``, which adds the mobjects to the scene
+and begins the animations as usual.
+
+Code between the calls may look at the mobjects as it would between real
+plays: every animation is run to its end as soon as it is scheduled, so the
+next one starts from the right state, and ``Scheduled`` rewinds them all to
+their starting states before it plays them back in order. Each animation is
+cleaned up from the scene when it ends in the playback, so a remover's
+mobject leaves the scene then rather than when it was scheduled.
+
+Animations pair the submobjects of their mobjects with the starting copies
+they took when they were begun, so code in between must not add or remove
+submobjects of a mobject that is already animated in the block (e.g. the
+glyphs of a line of text that was moved); the block raises ``ValueError``
+when it ends if it did. Such code, and code that must run after an
+animation has really been played, goes in a ``paused`` block.
+"""
+
+from contextlib import contextmanager
+
+import numpy as np
+from manim import AnimationGroup, Group, Wait
+
+
+def interpolated(animation):
+    """Return the ids of the submobjects ``animation`` interpolates, member by member for groups."""
+    if isinstance(animation, AnimationGroup):
+        return [interpolated(member) for member in animation.animations]
+    if animation.mobject is None:
+        return []
+    return [tuple(map(id, mobject.family_members_with_points())) for mobject in animation.get_all_mobjects()]
+
+
+class Scheduled(AnimationGroup):
+    """
+    Animations that start at the given offsets, in seconds.
+
+    The animations must already have been begun and finished in order, as
+    ``Timeline.play`` does: ``begin`` rewinds them rather than beginning them
+    again. ``duration`` may run past the last one to keep a trailing wait.
+    To play it on a scene, pass the animated mobject the scene lists first
+    as ``group`` and the scene itself as ``scene``; each animation is then
+    cleaned up from the scene as soon as it ends.
+    """
+
+    def __init__(self, *animations, starts, duration=0.0, scene=None, **kwargs):
+        self.starts = list(starts)
+        self.duration = duration
+        self.scene = scene
+        super().__init__(*animations, **kwargs)
+
+    def build_animations_with_timings(self):
+        super().build_animations_with_timings()
+        timings = self.anims_with_timings
+        run_times = timings["end"] - timings["start"]
+        timings["start"] = self.starts
+        timings["end"] = timings["start"] + run_times
+
+    def init_run_time(self, run_time):
+        super().init_run_time(run_time)
+        self.max_end_time = max(self.max_end_time, self.duration)
+        return self.max_end_time if run_time is None else run_time
+
+    def begin(self):
+        if not self.animations:
+            raise ValueError(f"Trying to play {self} without animations")
+        self.anim_group_time = 0.0
+        self.cleaned_up = np.zeros(len(self.animations), dtype=bool)
+        self.removed = []
+        if self.suspend_mobject_updating:
+            self.group.suspend_updating()
+        # Latest first, so every mobject ends up as its first animation found it
+        for animation in reversed(self.animations):
+            animation.interpolate(0)
+
+    def interpolate(self, alpha):
+        begun = self.anims_begun
+        super().interpolate(alpha)
+        if self.scene is None:
+            return
+        animations = self.anims_with_timings["anim"]
+        # A mobject that left with an earlier remover comes back, as a later play would add it
+        for animation in animations[self.anims_begun & ~begun]:
+            if animation.mobject in self.removed:
+                self.removed.remove(animation.mobject)
+                self.scene.add(animation.mobject)
+        for index in np.flatnonzero(self.anims_finished & ~self.cleaned_up):
+            self.clean_up_member(index, self.scene)
+
+    def clean_up_member(self, index, scene):
+        animation = self.animations[index]
+        animation.clean_up_from_scene(scene)
+        if animation.is_remover():
+            self.removed.append(animation.mobject)
+        self.cleaned_up[index] = True
+
+    def clean_up_from_scene(self, scene):
+        for index in np.flatnonzero(~self.cleaned_up):
+            self.clean_up_member(index, scene)
+
+
+class Timeline:
+    """
+    A stand-in for a scene's renderer that schedules plays instead of rendering them.
+
+    Everything but ``play`` is left to the real ``renderer``.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.clear()
+
+    def __getattr__(self, name):
+        # The camera, the file writer, the number of plays, ...
+        return getattr(self.renderer, name)
+
+    def clear(self):
+        self.animations = []
+        self.starts = []
+        self.families = []
+        # Where the next play starts unless given a start of its own
+        self.end = 0.0
+
+    def play(self, scene, *args, start=None, **kwargs):
+        """
+        Schedule a ``scene.play``/``scene.wait`` call.
+
+        The animations start at ``start`` seconds, or after everything
+        scheduled so far; the other keyword arguments (``run_time``,
+        ``rate_func``, ...) are applied as by ``Scene.play``. An explicit
+        ``start`` may overlap earlier plays, but not ones animating the
+        same mobject: those must be scheduled in the order they play.
+        """
+        start = self.end if start is None else start
+        if len(args) == 1 and isinstance(args[0], Wait):
+            self.end = max(self.end, start + args[0].run_time)
+            return
+        scene.compile_animation_data(*args, **kwargs)
+        scene.begin_animations()
+        end = start
+        for animation in scene.animations:
+            # Run it to the end now, so later code sees the state it leaves behind
+            animation.finish()
+            self.animations.append(animation)
+            self.starts.append(start)
+            self.families.append(interpolated(animation))
+            end = max(end, start + animation.get_run_time())
+        self.end = max(self.end, end)
+
+    def build(self, scene):
+        """Return everything scheduled as one animation to play on ``scene``."""
+        for animation, families in zip(self.animations, self.families):
+            if interpolated(animation) != families:
+                raise ValueError(
+                    f"The submobjects of {animation.mobject} changed after {animation} was scheduled; "
+                    "change them in a paused block"
+                )
+        # The scene redraws everything from the first animated mobject on
+        animated = {id(animation.mobject) for animation in self.animations}
+        group = next(
+            (mobject for mobject in scene.get_mobject_family_members() if id(mobject) in animated),
+            Group(),
+        )
+        return Scheduled(*self.animations, starts=self.starts, duration=self.end, group=group, scene=scene)
+
+    def play_on(self, scene):
+        """Play everything scheduled on ``scene`` with the real renderer and start over."""
+        if self.animations:
+            scene.play(self.build(scene))
+        elif self.end:
+            scene.wait(self.end)
+        self.clear()
+
+
+@contextmanager
+def coalesce(scene):
+    """
+    Collect ``scene.play``/``scene.wait`` in the block and play them as one.
+
+    Yields the ``Timeline``; ``scene.play`` also takes a ``start`` offset in
+    the block. Nested blocks add to the outermost timeline.
+    """
+    if isinstance(scene.renderer, Timeline):
+        yield scene.renderer
+        return
+    timeline = scene.renderer = Timeline(scene.renderer)
+    try:
+        yield timeline
+    finally:
+        scene.renderer = timeline.renderer
+    timeline.play_on(scene)
+
+
+@contextmanager
+def paused(scene):
+    """
+    Play ``scene.play``/``scene.wait`` in the block for real, inside a ``coalesce`` block.
+
+    Everything scheduled so far is played first and the timeline starts over
+    after the block, e.g. to finish an animation before code that depends
+    on how it really played.
+    """
+    timeline = scene.renderer
+    if not isinstance(timeline, Timeline):
+        yield
+        return
+    scene.renderer = timeline.renderer
+    try:
+        timeline.play_on(scene)
+        yield
+    finally:
+        scene.renderer = timeline
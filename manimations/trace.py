@@ -0,0 +1,177 @@
+"""
+Chrome trace-event profiling of manim renders.
+
+When enabled, every ``self.play``/``self.wait`` becomes a span tagged with
+the scene source line that issued it, and manim's internals are wrapped in
+nested spans for each phase of the call:
+
+    play / wait     the call itself, with the source line and statement
+      compile       building the animations and their arguments
+      hash          hashing the call for the partial movie cache
+      cache         looking the segment up in the caches
+      begin         Animation.begin for every animation
+      interpolate   updaters and Animation.interpolate, once per frame
+      rasterize     Cairo drawing the mobjects, once per frame
+      write         handing the frame to the encoder
+      flush         draining the encoder at the end of the segment
+
+``Text`` and ``MarkupText`` construction (Pango layout and SVG parsing) and
+video encoding on manim's writer thread are recorded as spans of their own.
+The result is a JSON file that chrome://tracing or https://ui.perfetto.dev
+can open.
+
+Tracing is opt-in: ``manimations.launch`` installs it when
+``MANIMATIONS_TRACE`` names an output directory.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from manimations.callsite import call_site, statement_source
+from manimations.render import SECTION_ENV
+
+# Environment variable naming the directory trace files are written to
+TRACE_ENV = "MANIMATIONS_TRACE"
+
+
+class Tracer:
+    """Collects complete ("X") trace events for one process."""
+
+    def __init__(self):
+        self.events = []
+        self.pid = os.getpid()
+        self.origin = time.perf_counter_ns()
+        self.thread_names = {}
+        self.scene_name = None
+        self._local = threading.local()
+
+    def now(self):
+        # Trace timestamps are microseconds
+        return (time.perf_counter_ns() - self.origin) / 1000
+
+    @contextmanager
+    def span(self, name, cat="manim", **args):
+        tid = threading.get_ident()
+        self.thread_names.setdefault(tid, threading.current_thread().name)
+        start = self.now()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start,
+                "dur": self.now() - start,
+                "pid": self.pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            # list.append is atomic, so the writer thread can record too
+            self.events.append(event)
+
+    def wrap(self, owner, attr, name, cat="manim", args=None):
+        """Replace ``owner.attr`` with a version that records a span per call."""
+        original = getattr(owner, attr)
+
+        @functools.wraps(original)
+        def traced(*call_args, **call_kwargs):
+            span_args = args(*call_args, **call_kwargs) if args else {}
+            with self.span(name, cat, **span_args):
+                return original(*call_args, **call_kwargs)
+
+        setattr(owner, attr, traced)
+
+    @property
+    def in_call(self):
+        # Whether a play/wait span is already open on this thread
+        return getattr(self._local, "in_call", False)
+
+    @in_call.setter
+    def in_call(self, value):
+        self._local.in_call = value
+
+    def to_json(self):
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": self.scene_name or "manim"}},
+        ]
+        for tid, thread_name in self.thread_names.items():
+            metadata.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": thread_name}})
+        return {"traceEvents": metadata + sorted(self.events, key=lambda e: e["ts"]), "displayTimeUnit": "ms"}
+
+    def write(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        name = self.scene_name or f"manim-{self.pid}"
+        section = os.environ.get(SECTION_ENV)
+        if section:
+            name = f"{name}_{section}"
+        path = directory / f"{name}.trace.json"
+        path.write_text(json.dumps(self.to_json()), encoding="utf-8")
+        return path
+
+
+def install(tracer, directory):
+    """Wrap manim's play pipeline with ``tracer`` and write the trace at exit."""
+    from manim import MarkupText, Scene, Text
+    from manim.renderer import cairo_renderer
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    def call(kind):
+        original = getattr(Scene, kind)
+
+        @functools.wraps(original)
+        def traced(scene, *args, **kwargs):
+            # wait() is implemented with play(); only the outer call gets a span
+            if tracer.in_call:
+                return original(scene, *args, **kwargs)
+            filename, lineno = call_site(scene)
+            tracer.in_call = True
+            try:
+                with tracer.span(
+                    f"{kind} {Path(filename).name}:{lineno}",
+                    "call",
+                    line=f"{filename}:{lineno}",
+                    source=statement_source(filename, lineno),
+                    play_index=scene.renderer.num_plays,
+                ):
+                    return original(scene, *args, **kwargs)
+            finally:
+                tracer.in_call = False
+
+        setattr(Scene, kind, traced)
+
+    call("play")
+    call("wait")
+
+    def scene_args(scene, *args, **kwargs):
+        tracer.scene_name = type(scene).__name__
+        return {"scene": tracer.scene_name}
+
+    tracer.wrap(Scene, "render", "render", "scene", args=scene_args)
+    tracer.wrap(Scene, "compile_animation_data", "compile")
+    tracer.wrap(cairo_renderer, "get_hash_from_play_call", "hash")
+    tracer.wrap(SceneFileWriter, "is_already_cached", "cache")
+    tracer.wrap(Scene, "begin_animations", "begin")
+    tracer.wrap(Scene, "update_to_time", "interpolate", args=lambda scene, t: {"t": t})
+    tracer.wrap(CairoRenderer, "update_frame", "rasterize")
+    tracer.wrap(SceneFileWriter, "write_frame", "write")
+    tracer.wrap(SceneFileWriter, "encode_and_write_frame", "encode", "ffmpeg")
+    tracer.wrap(SceneFileWriter, "close_partial_movie_stream", "flush", "ffmpeg")
+    tracer.wrap(SceneFileWriter, "combine_to_movie", "combine", "ffmpeg")
+
+    def text_args(mobject, text, *args, **kwargs):
+        return {"text": text}
+
+    tracer.wrap(Text, "__init__", "Text", "mobject", args=text_args)
+    tracer.wrap(MarkupText, "__init__", "MarkupText", "mobject", args=text_args)
+
+    atexit.register(tracer.write, directory)
@@ -0,0 +1,61 @@
+import av
+import numpy as np
+import pytest
+
+from manimations.bench import compare, count_frames, format_comparison
+
+
+def write_video(path, codec, frames=30, rate=15, format=None):
+    with av.open(str(path), "w", format=format) as container:
+        stream = container.add_stream(codec, rate=rate)
+        stream.width, stream.height, stream.pix_fmt = 32, 32, "yuv420p"
+        for index in range(frames):
+            image = np.full((32, 32, 3), index * 8, dtype=np.uint8)
+            container.mux(stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")))
+        container.mux(stream.encode())
+    return path
+
+
+@pytest.mark.parametrize("name, codec, format", [
+    # Stores a frame count
+    ("scene.mp4", "libx264", None),
+    # Stores only the container's duration
+    ("scene.webm", "libvpx-vp9", None),
+    # Stores neither, so the frames are decoded and counted
+    ("scene.h264", "libx264", "h264"),
+])
+def test_count_frames(tmp_path, name, codec, format):
+    assert count_frames(write_video(tmp_path / name, codec, format=format)) == 30
+
+
+def run(*records):
+    return {"results": [
+        {"scene": scene, "quality": quality, "wall_time": wall_time, "peak_rss": peak_rss}
+        for scene, quality, wall_time, peak_rss in records
+    ]}
+
+
+def test_compare_flags_changes_above_the_threshold():
+    baseline = run(("Loop", "l", 10.0, 1000), ("Loop", "h", 40.0, 2000))
+    current = run(("Loop", "l", 11.5, 1100), ("Loop", "h", 46.4, 1000))
+    rows = {(row["quality"], row["metric"]): row for row in compare(current, baseline, threshold=0.15)}
+
+    assert rows["l", "wall_time"]["change"] == pytest.approx(0.15)
+    assert not rows["l", "wall_time"]["regression"]
+    assert not rows["l", "peak_rss"]["regression"]
+    assert rows["h", "wall_time"]["regression"]
+    # Getting faster or smaller is never a regression
+    assert rows["h", "peak_rss"]["change"] == pytest.approx(-0.5)
+    assert not rows["h", "peak_rss"]["regression"]
+
+
+def test_compare_skips_what_the_baseline_lacks():
+    baseline = run(("Loop", "l", 10.0, None), ("Split", "l", 0, 500))
+    current = run(("Loop", "l", 20.0, 800), ("Loop", "m", 30.0, 800), ("Split", "l", 5.0, 600))
+    rows = compare(current, baseline, threshold=0.15)
+    assert [(row["scene"], row["quality"], row["metric"]) for row in rows] == [
+        ("Loop", "l", "wall_time"),
+        ("Split", "l", "peak_rss"),
+    ]
+    assert all(row["regression"] for row in rows)
+    assert format_comparison(rows, 0.15).endswith("2 regression(s) above 15%")
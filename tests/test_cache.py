@@ -0,0 +1,111 @@
+import importlib
+import os
+import sys
+
+from manimations.cache import RenderCache, code_fingerprint, segment_key
+
+KEY_A = "a" * 40
+KEY_B = "b" * 40
+KEY_C = "c" * 40
+
+
+def segment(tmp_path, name, size):
+    path = tmp_path / "renders" / f"{name}.mp4"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(name.encode()[:1] * size)
+    return path
+
+
+def age(cache, key, seconds):
+    # Mark a stored segment as last used ``seconds`` ago
+    path = cache.path_for(key, ".mp4")
+    when = path.stat().st_mtime - seconds
+    os.utime(path, (when, when))
+
+
+def test_put_and_fetch(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    stored = cache.put(KEY_A, segment(tmp_path, "a", 10))
+    assert stored == cache.path_for(KEY_A, ".mp4")
+
+    target = tmp_path / "media" / f"{KEY_A}.mp4"
+    assert cache.fetch(KEY_A, target)
+    assert target.read_bytes() == b"a" * 10
+    assert not cache.fetch(KEY_B, tmp_path / "media" / f"{KEY_B}.mp4")
+    assert not (tmp_path / "media" / f"{KEY_B}.mp4").exists()
+
+
+def test_fetch_needs_the_same_extension(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    cache.put(KEY_A, segment(tmp_path, "a", 10))
+    assert not cache.fetch(KEY_A, tmp_path / "media" / f"{KEY_A}.webm")
+
+
+def test_evict_least_recently_used_first(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_bytes=1000)
+    cache.put(KEY_A, segment(tmp_path, "a", 400))
+    age(cache, KEY_A, 30)
+    cache.put(KEY_B, segment(tmp_path, "b", 400))
+    age(cache, KEY_B, 20)
+    # Only two segments fit, so storing a third evicts the oldest
+    cache.put(KEY_C, segment(tmp_path, "c", 400))
+    assert [path.stem for _, _, path in cache.entries()] == [KEY_B, KEY_C]
+
+    # A lookup counts as a use, so B now outlives C
+    age(cache, KEY_C, 10)
+    assert cache.get(KEY_B, ".mp4") is not None
+    cache.max_bytes = 400
+    assert cache.evict() == 1
+    assert [path.stem for _, _, path in cache.entries()] == [KEY_B]
+
+
+def test_stats(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_bytes=1000)
+    cache.put(KEY_A, segment(tmp_path, "a", 300))
+    cache.put(KEY_B, segment(tmp_path, "b", 300))
+    cache.fetch(KEY_A, tmp_path / "media" / "a.mp4")
+    cache.fetch(KEY_C, tmp_path / "media" / "c.mp4")
+    cache.put(KEY_C, segment(tmp_path, "c", 600))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == 900
+    assert (stats["hits"], stats["misses"], stats["stored"], stats["evicted"]) == (1, 1, 3, 1)
+    assert stats["hit_rate"] == 0.5
+
+    cache.reset_stats()
+    assert cache.stats()["hits"] == 0
+    assert cache.stats()["entries"] == 2
+
+
+def test_segment_key_covers_every_part():
+    fingerprint = {"pixel_width": 854, "frame_rate": 15}
+    key = segment_key("play", fingerprint, "self.play(Create(line))", "code")
+    assert len(key) == 40
+    assert key == segment_key("play", dict(reversed(fingerprint.items())), "self.play(Create(line))", "code")
+    assert key != segment_key("other", fingerprint, "self.play(Create(line))", "code")
+    assert key != segment_key("play", {**fingerprint, "frame_rate": 60}, "self.play(Create(line))", "code")
+    assert key != segment_key("play", fingerprint, "self.play(FadeIn(line))", "code")
+    assert key != segment_key("play", fingerprint, "self.play(Create(line))", "edited")
+
+
+def test_code_fingerprint_follows_loaded_project_modules(tmp_path, monkeypatch):
+    project = tmp_path / "project"
+    project.mkdir()
+    helper = project / "cache_test_helper.py"
+    helper.write_text("SPEED = 1\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(project))
+
+    before = code_fingerprint(project)
+    importlib.import_module("cache_test_helper")
+    try:
+        loaded = code_fingerprint(project)
+        assert loaded != before
+        assert code_fingerprint(project) == loaded
+
+        helper.write_text("SPEED = 2\n", encoding="utf-8")
+        os.utime(helper, ns=(0, 0))
+        assert code_fingerprint(project) != loaded
+    finally:
+        del sys.modules["cache_test_helper"]
+    assert code_fingerprint(project) == before
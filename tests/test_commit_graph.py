@@ -0,0 +1,57 @@
+import numpy as np
+
+from commit_graph import CommitGraph
+from git_history import Commit, History, demo_history
+
+
+def history(main, **branches):
+    """A history whose branches are given as ``name=(first column, last column)``."""
+    spans = {main: (1, 10), **branches}
+    result = History(main)
+    for name, (first, last) in spans.items():
+        chain = [
+            Commit(f"{name}{column}", (), branch=name, index=index, column=column)
+            for index, column in enumerate(range(first, last + 1), 1)
+        ]
+        result.branches[name] = chain
+        result.commits.extend(chain)
+    return result
+
+
+def test_branches_reuse_lanes_once_free():
+    lanes, count = CommitGraph._assign_lanes(history(
+        "main",
+        # Forks after column 1 and ends at 3
+        early=(2, 3),
+        # Forks after column 4, once early has ended
+        later=(5, 6),
+        # Forks while later is still going
+        overlap=(6, 8),
+        # Forks after column 8, once both are done
+        last=(9, 9),
+    ))
+    assert lanes == {"main": 0, "early": 1, "later": 1, "overlap": 2, "last": 1}
+    assert count == 3
+
+
+def test_a_branch_forking_where_another_ends_gets_its_own_lane():
+    # Its line would start on the other branch's last commit
+    lanes, count = CommitGraph._assign_lanes(history("main", first=(2, 3), second=(4, 5)))
+    assert lanes["first"] != lanes["second"]
+    assert count == 3
+
+
+def test_demo_history_keeps_the_original_layout():
+    # The coordinates GitAndTreeSplit drew its example history at by hand
+    graph = CommitGraph(demo_history(), left=-4.15, top=1, width=4.6, height=4.5, colors=["blue", "orange"])
+    points = {node.commit.name: node.point for node in graph.nodes.values()}
+    assert points.keys() == {"githash1", "githash2", "githash3"}
+    assert np.allclose(points["githash1"], [-2.95, 1, 0])
+    assert np.allclose(points["githash2"], [-1.75, 1, 0])
+    assert np.allclose(points["githash3"], [-2.95, 0, 0])
+    assert np.allclose(graph.branches["develop"].start, [-4.15, 1, 0])
+    assert np.allclose(graph.branches["pull/1234"].start, [-4.15, 0, 0])
+    assert graph.branches["pull/1234"].color == "orange"
+    assert graph.dot_radius == 0.12
+    assert graph.node("develop", 2) is graph.tags["v1.0.0"]
+    assert np.allclose(graph.tag_tip("v1.0.0"), [-1.75, 1.4, 0])
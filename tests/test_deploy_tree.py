@@ -0,0 +1,78 @@
+from deploy_tree import DeployTree
+from git_history import Commit
+
+
+def deploy(tree, branch, *names):
+    return [tree.add_commit(Commit(name, (), branch=branch)) for name in names]
+
+
+def texts(tree):
+    return [text for text, _ in tree.lines(indent="")]
+
+
+def test_builds_land_under_their_branch():
+    tree = DeployTree("develop")
+    assert deploy(tree, "develop", "githash1") == [("develop/", "githash1/")]
+    assert deploy(tree, "pull/1234", "githash2") == [("pull/", "1234/", "githash2/")]
+    assert tree.set_head("pull/1234") == ("pull/", "1234/", "HEAD")
+    assert tree.add_tag("v1.0.0") == ("tags/", "v1.0.0/")
+    assert texts(tree) == [
+        "├── develop/",
+        "│   └── githash1/",
+        "│       └── module1/",
+        "│           └── index.html",
+        "├── pull/",
+        "│   └── 1234/",
+        "│       ├── githash2/",
+        "│       │   └── module1/",
+        "│       │       └── index.html",
+        "│       └── HEAD",
+        "└── tags/",
+        "    └── v1.0.0/",
+        "        └── module1/",
+        "            └── index.html",
+    ]
+
+
+def test_older_entries_are_summarized():
+    tree = DeployTree("develop", keep_builds=2, keep_branches=1, keep_tags=1)
+    deploy(tree, "develop", "d1", "d2", "d3", "d4")
+    tree.set_head("develop")
+    deploy(tree, "pull/1", "p1")
+    tree.set_head("pull/1")
+    deploy(tree, "pull/2", "p2")
+    deploy(tree, "pull/3", "p3")
+    tree.add_tag("v1")
+    tree.add_tag("v2")
+    assert texts(tree) == [
+        "├── develop/",
+        "│   ├── … 2 older",
+        "│   ├── d3/",
+        "│   │   └── module1/",
+        "│   │       └── index.html",
+        "│   ├── d4/",
+        "│   │   └── module1/",
+        "│   │       └── index.html",
+        "│   └── HEAD",
+        "├── pull/",
+        "│   ├── … 2 more",
+        "│   └── 3/",
+        "│       └── p3/",
+        "│           └── module1/",
+        "│               └── index.html",
+        "└── tags/",
+        "    ├── … 1 more",
+        "    └── v2/",
+        "        └── module1/",
+        "            └── index.html",
+    ]
+
+
+def test_lines_carry_their_paths():
+    tree = DeployTree("main", keep_builds=1)
+    deploy(tree, "main", "a", "b")
+    assert tree.lines(indent="    ")[:3] == [
+        ("    └── main/", ("main/",)),
+        ("        ├── … 1 older", ("main/", "… 1 older")),
+        ("        └── b/", ("main/", "b/")),
+    ]
@@ -0,0 +1,131 @@
+import random
+from collections import Counter
+
+import pytest
+
+from docs_source import Reservoir, iter_blocks, read_levels
+
+
+def blocks(tmp_path, text, name="page.rst"):
+    path = tmp_path / name
+    path.write_text(text)
+    return list(iter_blocks(path))
+
+
+def test_the_reservoir_keeps_the_first_items_in_order():
+    reservoir = Reservoir(5, random.Random(0))
+    assert all(reservoir.offer(item) for item in "abc")
+    assert reservoir.items() == ["a", "b", "c"]
+    assert reservoir.seen == 3
+
+
+def test_the_reservoir_samples_uniformly_in_offer_order():
+    kept = Counter()
+    rng = random.Random(1)
+    for _ in range(2000):
+        reservoir = Reservoir(3, rng)
+        for item in range(10):
+            reservoir.offer(item)
+        items = reservoir.items()
+        assert len(items) == 3 and items == sorted(items)
+        kept.update(items)
+    # Every item is kept about 3 times in 10
+    assert all(500 < kept[item] < 700 for item in range(10))
+
+
+def test_rst_adornments_make_headings(tmp_path):
+    assert blocks(tmp_path, """\
+=====
+Title
+=====
+
+Intro text that goes
+on for two lines.
+
+Section
+-------
+
+Body.
+""") == [
+        ("heading", "Title"),
+        ("paragraph", "Intro text that goes on for two lines."),
+        ("heading", "Section"),
+        ("paragraph", "Body."),
+    ]
+
+
+def test_front_matter_gives_the_title_and_is_not_prose(tmp_path):
+    assert blocks(tmp_path, """\
+---
+title: "The *title*"
+tags: [a, b]
+---
+# Heading #
+
+Some `inline` [text](http://example.com).
+""", "page.md") == [
+        ("heading", "The title"),
+        ("heading", "Heading"),
+        ("paragraph", "Some inline text."),
+    ]
+
+
+def test_fenced_code_is_skipped(tmp_path):
+    assert blocks(tmp_path, """\
+Before.
+
+```python
+print("not prose")
+
+more = code
+```
+
+After.
+""", "page.md") == [("paragraph", "Before."), ("paragraph", "After.")]
+
+
+def test_literal_blocks_and_directives_are_skipped(tmp_path):
+    assert blocks(tmp_path, """\
+Run it like this::
+
+    $ make html
+
+    $ make clean
+
+.. note::
+   Not prose either.
+
+Done.
+""") == [("paragraph", "Run it like this::"), ("paragraph", "Done.")]
+
+
+@pytest.fixture
+def docs(tmp_path):
+    (tmp_path / "conf.py").write_text("project = 'Demo'\n")
+    for number in range(12):
+        (tmp_path / f"page{number:02}.rst").write_text(f"""\
+Page {number}
+=======
+
+Overview
+--------
+
+First sentence of page {number}. Second sentence here.
+
+Another paragraph. With two sentences.
+
+Details
+-------
+
+More words in the details.
+""")
+    return tmp_path
+
+
+def test_read_levels_is_deterministic(docs):
+    levels = read_levels(docs, sample=5)
+    assert [level.kind for level in levels] == ["word", "sentence", "paragraph", "section", "page", "docs site"]
+    assert levels[-1].label == "Demo"
+    assert len(levels[-1].children) <= 2 * 4 - 1
+    assert read_levels(docs, sample=5) == levels
+    assert read_levels(docs, sample=5, seed=1) != levels
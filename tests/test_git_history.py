@@ -0,0 +1,98 @@
+import os
+import subprocess
+
+import pytest
+
+from git_history import read_history
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """
+    A repository with this history, oldest first::
+
+        main     c1 ── c2 ──────────── m1 ── m2
+                   \\                  /     /
+        feature     f1 ── f2 ────────      /
+        gone               \\── g1 ───────
+    """
+    path = tmp_path / "repo"
+    path.mkdir()
+    clock = iter(range(1_700_000_000, 1_800_000_000, 60))
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+    def git(*args):
+        date = f"@{next(clock)} +0000"
+        env = {
+            "GIT_AUTHOR_NAME": "Test", "GIT_AUTHOR_EMAIL": "test@example.com", "GIT_AUTHOR_DATE": date,
+            "GIT_COMMITTER_NAME": "Test", "GIT_COMMITTER_EMAIL": "test@example.com", "GIT_COMMITTER_DATE": date,
+        }
+        subprocess.run(["git", "-C", str(path), *args], env={**os.environ, **env}, check=True, capture_output=True)
+
+    def commit(subject):
+        git("commit", "--allow-empty", "-m", subject)
+
+    git("init", "-b", "main")
+    commit("c1")
+    git("tag", "v0.1")
+    git("switch", "-c", "feature")
+    commit("f1")
+    commit("f2")
+    git("switch", "-c", "gone")
+    commit("g1")
+    git("switch", "main")
+    commit("c2")
+    git("tag", "-a", "v1.0", "-m", "Release 1.0")
+    git("merge", "--no-ff", "-m", "m1", "feature")
+    git("merge", "--no-ff", "-m", "m2", "gone")
+    git("branch", "-D", "gone")
+    return path
+
+
+def subjects(commits):
+    return [commit.subject for commit in commits]
+
+
+def test_branches_claim_their_first_parent_chains(repo):
+    history = read_history(repo)
+    assert history.main == "main"
+    assert {name: subjects(chain) for name, chain in history.branches.items()} == {
+        "main": ["c1", "c2", "m1", "m2"],
+        "feature": ["f1", "f2"],
+    }
+    assert list(history.branches) == ["main", "feature"]
+    assert [commit.index for commit in history.branches["feature"]] == [1, 2]
+
+
+def test_commits_come_parents_first_with_columns(repo):
+    history = read_history(repo)
+    # g1 is only reachable through the merge of a deleted branch
+    assert sorted(subjects(history.commits)) == ["c1", "c2", "f1", "f2", "m1", "m2"]
+    seen = set()
+    for commit in history.commits:
+        assert all(parent in seen for parent in commit.parents if parent in {c.sha for c in history.commits})
+        seen.add(commit.sha)
+    columns = {commit.subject: commit.column for commit in history.commits}
+    assert columns == {"c1": 1, "f1": 2, "f2": 3, "c2": 2, "m1": 4, "m2": 5}
+    assert all(len(commit.name) == 7 for commit in history.commits)
+
+
+def test_tags_point_at_commits(repo):
+    history = read_history(repo)
+    # The annotated tag is peeled to its commit
+    assert {name: commit.subject for name, commit in history.tags.items()} == {"v0.1": "c1", "v1.0": "c2"}
+
+
+def test_limits(repo):
+    history = read_history(repo, branches=["main"])
+    assert list(history.branches) == ["main"]
+
+    # Only the newest commits are read; the branch starts at the first of them
+    history = read_history(repo, max_commits=3)
+    assert subjects(history.branches["main"]) == ["m1", "m2"]
+    assert len(history.commits) <= 3
+    assert history.tags == {}
+
+    with pytest.raises(ValueError):
+        read_history(repo, main="develop")
@@ -0,0 +1,45 @@
+import numpy as np
+from manim import RED, Circle, Square, VGroup
+
+from manimations.highlight import GlowFade, GlowPool
+
+
+def outline(glow):
+    return [slot.points for slot in glow.submobjects if len(slot.points)]
+
+
+def test_acquire_copies_the_source_points():
+    source = VGroup(Square(), Circle())
+    glow = GlowPool().acquire(source, color=RED)
+    for slot, leaf in zip(glow.submobjects, source.submobjects):
+        assert np.array_equal(slot.points, leaf.points)
+        assert not np.shares_memory(slot.points, leaf.points)
+    assert glow.glow_opacity == 0
+
+
+def test_a_fade_outlines_the_source_as_it_is_when_it_begins():
+    square = Square()
+    source = VGroup(square)
+    glow = GlowPool().acquire(source, color=RED)
+    # A transform replaces the points rather than editing them
+    square.set_points(Circle().points + 1)
+    fade = GlowFade(glow, 0, 1)
+    fade.begin()
+    assert np.array_equal(outline(glow)[0], square.points)
+    fade.interpolate(0.5)
+    assert 0 < glow.glow_opacity < 1
+
+
+def test_released_overlays_are_reused_with_their_buffers():
+    pool = GlowPool()
+    glow = pool.acquire(VGroup(Circle(), Square()), color=RED)
+    buffers = list(glow.buffers)
+    glow.release()
+    assert outline(glow) == []
+
+    again = pool.acquire(VGroup(Square()), color=RED)
+    assert again is glow
+    assert pool.created == 1
+    assert len(outline(again)) == 1
+    # The square fits in the buffer the circle left behind
+    assert np.shares_memory(again.submobjects[0].points, buffers[0])
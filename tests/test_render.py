@@ -0,0 +1,102 @@
+from pathlib import Path
+
+from manimations.render import (
+    SceneSpec,
+    discover_scenes,
+    find_scene_classes,
+    find_sections,
+    select_scenes,
+    split_sections,
+)
+
+
+def write(path, source):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def test_find_scene_classes_in_source_order(tmp_path):
+    path = write(tmp_path / "main.py", """
+from manim import *
+import manim
+
+class Helper:
+    pass
+
+class Second(manim.MovingCameraScene):
+    pass
+
+class First(Scene):
+    pass
+""")
+    assert find_scene_classes(path) == ["Second", "First"]
+
+
+def test_find_scene_classes_follows_local_subclasses(tmp_path):
+    # The subclass comes before its base, so it is only found on a second pass
+    path = write(tmp_path / "main.py", """
+class Loop(Base):
+    pass
+
+class Base(Scene):
+    pass
+
+class NotAScene(Helper):
+    pass
+""")
+    assert find_scene_classes(path) == ["Loop", "Base"]
+
+
+def test_discover_scenes_skips_shared_and_hidden_directories(tmp_path):
+    write(tmp_path / "beta" / "main.py", "class B(Scene): pass\n")
+    write(tmp_path / "alpha" / "main.py", "class A(Scene): pass\n")
+    write(tmp_path / "manimations" / "main.py", "class Shared(Scene): pass\n")
+    write(tmp_path / ".hidden" / "main.py", "class Hidden(Scene): pass\n")
+    specs = discover_scenes(tmp_path)
+    assert [(spec.project, spec.name) for spec in specs] == [("alpha", "A"), ("beta", "B")]
+
+
+def test_select_scenes_by_class_or_project():
+    specs = [
+        SceneSpec(Path("holarchy/main.py"), "DocumentationHolarchy"),
+        SceneSpec(Path("holarchy/main.py"), "HolarchyLoop"),
+        SceneSpec(Path("docs-deploy/main.py"), "GitAndTreeSplit"),
+    ]
+    assert select_scenes(specs, []) == specs
+    assert select_scenes(specs, ["holarchy"]) == specs[:2]
+    assert select_scenes(specs, ["GitAndTreeSplit", "HolarchyLoop"]) == [specs[1], specs[2]]
+
+
+SECTIONED = """
+class Sectioned(SectionedScene):
+    SECTIONS = ("intro", "middle", "outro")
+
+    def setup_sections(self):
+        SECTIONS = ("not", "these")
+
+class Plain(Scene):
+    pass
+"""
+
+
+def test_find_sections_reads_the_class_attribute(tmp_path):
+    path = write(tmp_path / "main.py", SECTIONED)
+    assert find_sections(path, "Sectioned") == ("intro", "middle", "outro")
+    assert find_sections(path, "Plain") == ()
+    assert find_sections(path, "Missing") == ()
+
+
+def test_split_sections_gives_each_section_its_own_spec(tmp_path):
+    path = write(tmp_path / "project" / "main.py", SECTIONED)
+    specs = split_sections([SceneSpec(path, "Plain"), SceneSpec(path, "Sectioned")])
+    assert [(spec.name, spec.section) for spec in specs] == [
+        ("Plain", None),
+        ("Sectioned", "intro"),
+        ("Sectioned", "middle"),
+        ("Sectioned", "outro"),
+    ]
+    # Sections render into media directories of their own, under their own names
+    assert len({spec.media_dir for spec in specs}) == 4
+    assert specs[2].output_name == "Sectioned_middle"
+    assert str(specs[2]) == "project:Sectioned[middle]"
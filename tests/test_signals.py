@@ -0,0 +1,41 @@
+import numpy as np
+
+from manimations.signals import FirePulses, Signals, cascade
+
+
+def test_a_wave_fires_edge_by_edge_from_its_sources():
+    # 0 → 1 → 2 → 3, with 1 also leading to 4
+    pairs = [(2, 3), (0, 1), (1, 4), (1, 2)]
+    assert cascade(pairs, sources=[0]).tolist() == [2, 0, 1, 1]
+
+
+def test_several_sources_fire_together():
+    pairs = [(0, 2), (1, 3), (2, 4), (3, 4)]
+    assert cascade(pairs, sources=[0, 1]).tolist() == [0, 0, 1, 1]
+
+
+def test_edges_the_wave_never_reaches_do_not_fire():
+    # 3 → 0 leads into a source but nothing leads to 3
+    pairs = [(0, 1), (3, 0), (2, 1)]
+    assert cascade(pairs, sources=[0]).tolist() == [0, -1, -1]
+
+
+def test_every_edge_of_a_cycle_fires_once():
+    pairs = [(0, 1), (1, 2), (2, 0)]
+    assert cascade(pairs, sources=[0]).tolist() == [0, 1, 2]
+
+
+def test_no_edges_make_no_stages():
+    assert cascade(np.zeros((0, 2), dtype=int), sources=[]).tolist() == []
+
+
+def test_stages_fire_one_after_the_other():
+    signals = Signals.along([[0, 0, 0], [1, 0, 0], [2, 0, 0]], [(0, 1), (1, 2)])
+    fire = FirePulses(signals, stages=cascade([(0, 1), (1, 2)], sources=[0]))
+    fire.begin()
+    fire.interpolate(0.5)
+    assert np.allclose(signals.progress, [1, 0])
+    fire.interpolate(0.75)
+    assert signals.progress[0] == 1 and 0 < signals.progress[1] < 1
+    fire.finish()
+    assert np.allclose(signals.positions, [[1, 0, 0], [2, 0, 0]])
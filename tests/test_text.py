@@ -0,0 +1,72 @@
+from manim import BLUE, RED, ManimColor, Square
+
+from manimations.text import TextCache
+
+
+class Factory:
+    """Stands in for ``Text``: builds a square per call and counts the calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text, **kwargs):
+        self.calls.append((text, kwargs))
+        return Square(side_length=len(text), color=kwargs.get("color", BLUE))
+
+
+def test_builds_each_label_once():
+    factory = Factory()
+    cache = TextCache(factory=factory)
+    cache("main", color=BLUE)
+    cache("main", color=BLUE)
+    cache("main", color=RED)
+    cache("develop", color=BLUE)
+    assert [text for text, _ in factory.calls] == ["main", "main", "develop"]
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 3, "maxsize": 256, "hit_rate": 0.25}
+
+
+def test_keyword_values_are_keyed_by_value():
+    factory = Factory()
+    cache = TextCache(factory=factory)
+    cache("main", color=BLUE)
+    cache("main", color=ManimColor(BLUE.to_hex()))
+    cache("main", color=BLUE, t2c={"ma": RED})
+    cache("main", color=BLUE, t2c={"ma": ManimColor(RED.to_hex())})
+    assert len(factory.calls) == 2
+
+
+def test_evicts_least_recently_used():
+    factory = Factory()
+    cache = TextCache(maxsize=2, factory=factory)
+    cache("a")
+    cache("b")
+    cache("a")
+    cache("c")
+    # "b" was used least recently, so it went and has to be built again
+    cache("a")
+    cache("b")
+    assert [text for text, _ in factory.calls] == ["a", "b", "c", "b"]
+    assert cache.stats()["size"] == 2
+
+
+def test_hands_out_independent_copies():
+    cache = TextCache(factory=Factory())
+    first = cache("main")
+    first.shift([3, 0, 0]).set_color(RED)
+    second = cache("main")
+    assert second is not first
+    assert abs(second.get_center()[0]) < 1e-9
+    assert second.get_color() != first.get_color()
+
+    second.points[0] += 1
+    assert (cache("main").points != second.points).any()
+
+
+def test_clear():
+    factory = Factory()
+    cache = TextCache(factory=factory)
+    cache("main")
+    cache.clear()
+    cache("main")
+    assert len(factory.calls) == 2
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from manim import LEFT, RIGHT, UP, FadeIn, FadeOut, Scene, Square, Transform, VGroup, tempconfig
+
+from manimations.timeline import Scheduled, Timeline, coalesce, paused
+
+
+@pytest.fixture
+def scene():
+    with tempconfig({"dry_run": True, "disable_caching": True}):
+        yield Scene()
+
+
+def shifted(square, offset):
+    # Begun and finished, as Timeline.play leaves an animation
+    animation = square.animate.shift(offset).build()
+    animation.begin()
+    animation.finish()
+    return animation
+
+
+def test_animations_start_at_their_offsets():
+    first, second = Square(), Square()
+    scheduled = Scheduled(shifted(first, RIGHT), shifted(second, UP), starts=[0, 1.5])
+    scheduled.begin()
+    assert np.allclose(first.get_center(), 0) and np.allclose(second.get_center(), 0)
+    scheduled.interpolate(1 / 2.5)
+    assert np.allclose(first.get_center(), RIGHT) and np.allclose(second.get_center(), 0)
+    scheduled.interpolate(2 / 2.5)
+    assert 0 < second.get_center()[1] < 1
+    scheduled.interpolate(1)
+    assert np.allclose(second.get_center(), UP)
+
+
+def test_the_run_time_covers_the_last_animation_and_a_trailing_wait():
+    animations = [shifted(Square(), RIGHT), shifted(Square(), UP)]
+    assert Scheduled(*animations, starts=[0, 2]).run_time == 3
+    assert Scheduled(*animations, starts=[0, 2], duration=4.5).run_time == 4.5
+    assert Scheduled(*animations, starts=[0, 2], run_time=6).max_end_time == 3
+
+
+def test_begin_rewinds_every_mobject_to_where_its_first_animation_found_it():
+    square = Square()
+    scheduled = Scheduled(shifted(square, RIGHT), shifted(square, UP), starts=[0, 1])
+    assert np.allclose(square.get_center(), RIGHT + UP)
+    scheduled.begin()
+    assert np.allclose(square.get_center(), 0)
+
+
+def test_a_block_is_played_as_one_animation(scene):
+    square = Square()
+    with coalesce(scene) as timeline:
+        scene.play(FadeIn(square))
+        # Later code sees the state the play left behind
+        assert square in scene.mobjects and square.get_fill_opacity() == 0
+        scene.play(square.animate.shift(RIGHT), run_time=0.5)
+        assert np.allclose(square.get_center(), RIGHT)
+        scene.wait(0.25)
+        scene.play(square.animate.shift(UP), start=0.5)
+        assert timeline.end == 1.75
+    assert scene.renderer.num_plays == 1
+    assert scene.time == pytest.approx(1.75)
+    assert np.allclose(square.get_center(), RIGHT + UP)
+
+
+def test_paused_plays_for_real_in_between(scene):
+    square = Square()
+    with coalesce(scene):
+        scene.play(FadeIn(square))
+        with paused(scene):
+            scene.play(square.animate.shift(RIGHT))
+            assert scene.renderer.num_plays == 2
+        scene.play(square.animate.shift(UP))
+    assert scene.renderer.num_plays == 3
+
+
+def test_a_remover_leaves_the_scene_when_it_ends_in_the_playback(scene):
+    gone, kept = Square(), Square()
+    scene.add(gone, kept)
+    timeline = scene.renderer = Timeline(scene.renderer)
+    scene.play(FadeOut(gone), run_time=1)
+    scene.play(kept.animate.shift(LEFT), run_time=1)
+    scene.renderer = timeline.renderer
+    # Scheduling runs it to the end but leaves the mobject for the playback
+    assert gone in scene.mobjects
+    scheduled = timeline.build(scene)
+    scheduled.begin()
+    scheduled.interpolate(0.25)
+    assert gone in scene.mobjects
+    scheduled.interpolate(0.75)
+    assert gone not in scene.mobjects and kept in scene.mobjects
+
+
+def test_the_playback_keeps_the_glyphs_in_their_rows(scene):
+    glyphs = [Square(), Square(), Square()]
+    row = VGroup(*glyphs)
+    block = VGroup(row)
+    scene.add(block)
+    with coalesce(scene):
+        scene.play(*[Transform(glyph, glyph.copy().shift(UP)) for glyph in glyphs])
+        scene.play(Transform(glyphs[1], glyphs[1].copy().shift(RIGHT)))
+    assert row.submobjects == glyphs and block.submobjects == [row]
+    assert scene.mobjects == [block]
+    assert np.allclose(glyphs[1].get_center(), UP + RIGHT)
+
+
+def test_changing_an_animated_family_in_the_block_is_an_error(scene):
+    row = VGroup(Square(), Square())
+    scene.add(row)
+    with pytest.raises(ValueError, match="paused"):
+        with coalesce(scene):
+            scene.play(row.animate.shift(UP))
+            row.add(Square())
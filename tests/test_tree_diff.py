@@ -0,0 +1,52 @@
+from tree_diff import diff_lines, glyph_changes
+
+
+def test_glyph_changes():
+    assert glyph_changes("├── a/", "└── a/") == [(0, "└")]
+    assert glyph_changes("abc", "abc") == []
+    # Shorter lines are padded with spaces on either side
+    assert glyph_changes("ab", "abcd") == [(2, "c"), (3, "d")]
+    assert glyph_changes("abcd", "ab") == [(2, " "), (3, " ")]
+
+
+def test_identical_lines_make_an_empty_diff():
+    lines = ["├── develop/", "└── tags/"]
+    diff = diff_lines(lines, list(lines))
+    assert not diff
+    assert diff.kept == [(0, 0, []), (1, 1, [])]
+
+
+def test_an_insertion_moves_the_lines_below():
+    old = ["a", "b", "c"]
+    new = ["a", "x", "b", "c"]
+    diff = diff_lines(old, new)
+    assert diff.inserted == [(1, "x")]
+    assert diff.removed == []
+    assert diff.moved == [(1, 2), (2, 3)]
+    assert diff.changed_glyphs == 0
+
+
+def test_a_removal():
+    diff = diff_lines(["a", "b", "c"], ["a", "c"])
+    assert diff.removed == [1]
+    assert diff.inserted == []
+    assert diff.moved == [(2, 1)]
+
+
+def test_a_replaced_run_changes_glyphs_in_place():
+    old = ["├── d1/", "└── d2/"]
+    new = ["├── d2/", "├── d3/", "└── d4/"]
+    diff = diff_lines(old, new)
+    assert diff.kept == [(0, 0, [(5, "2")]), (1, 1, [(0, "├"), (5, "3")])]
+    assert diff.inserted == [(2, "└── d4/")]
+    assert diff.changed_glyphs == 3
+
+
+def test_lines_are_matched_on_their_keys():
+    # The connector of "b" changes when "c" is added below it, but its key does not
+    old = ["├── a", "└── b"]
+    new = ["├── a", "├── b", "└── c"]
+    diff = diff_lines(old, new, old_keys=[("a",), ("b",)], new_keys=[("a",), ("b",), ("c",)])
+    assert diff.kept == [(0, 0, []), (1, 1, [(0, "├")])]
+    assert diff.inserted == [(2, "└── c")]
+    assert diff.removed == []